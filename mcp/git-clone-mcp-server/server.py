@@ -2,172 +2,436 @@
 from __future__ import annotations
 
 import argparse
-import logging
+import asyncio
 import os
-import subprocess
+import re
+import shutil
+import stat
 import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import requests
-from fastmcp import FastMCP
-from fastmcp.utilities.logging import get_logger as get_fastmcp_logger
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+import httpx
 from loguru import logger
+from typing_extensions import TypedDict
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
 
 # ---------------------------------------------------------------------
-# Logging configuration
+# MCP server and engine wiring
+# ---------------------------------------------------------------------
+# shared async HTTP client so repeated validations reuse pooled connections
+# without blocking the event loop.
+# pool limits go on the transport, since the client ignores its own limits
+# when given a transport. the client is closed by the server lifespan.
+_HTTP = httpx.AsyncClient(
+    headers={"Accept": "application/vnd.github+json"},
+    timeout=httpx.Timeout(10.0, connect=3.05),
+    transport=httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=4),
+        retries=2,
+    ),
+)
+
+# timeout for a single git clone, in seconds.
+_CLONE_TIMEOUT = 300
+
+# number of trailing git output lines kept for the response.
+_GIT_OUTPUT_TAIL_LINES = 64
+
+# timeout for the optional git ls-remote preflight, in seconds.
+_LS_REMOTE_TIMEOUT = 10
+
+# default number of clones run at once by the batch tool, about three
+# quarters of the cpus but never fewer than three.
+_MAX_PARALLEL_CLONES = max(3, (os.cpu_count() or 4) * 3 // 4)
+
+# github owner/repo names and branch names accepted by the clone tool.
+# anything else is rejected before touching the network or filesystem, so
+# it never reaches git as an argument.
+_REPO_RE = re.compile(
+    r"\A([A-Za-z0-9](?:[A-Za-z0-9-]{0,38}))/(?!\.\.?\Z)([A-Za-z0-9._-]{1,100})\Z"
+)
+_BRANCH_RE = re.compile(r"\A(?![-/])(?!.*\.\.)[A-Za-z0-9._/-]{1,255}\Z")
+
+# short-lived cache of parent directory checks, so batch clones under the
+# same parent do not re-stat it for every repository.
+# parent path -> (expires_at, is_dir, writable)
+_PARENT_CACHE_TTL = 1.0
+_PARENT_CACHE_MAX_ENTRIES = 1024
+_PARENT_CACHE: Dict[str, Tuple[float, bool, bool]] = {}
+
+# process credentials, used to decide writability from stat mode bits
+_EUID = os.geteuid()
+_GIDS = frozenset(os.getgroups()) | {os.getegid()}
+
+# never prompt for credentials and skip LFS downloads during clone.
+_GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0", "GIT_LFS_SKIP_SMUDGE": "1"}
+
+# short-lived cache of github API responses. least recently used entries
+# are evicted first.
+# (owner, repo) -> (expires_at, result, etag)
+_GITHUB_CACHE_TTL = 60.0
+_GITHUB_CACHE_MAX_ENTRIES = 1024
+_GITHUB_CACHE: OrderedDict[
+    Tuple[str, str], Tuple[float, ValidationResult, Optional[str]]
+] = OrderedDict()
+_GITHUB_CACHE_LOCK = threading.Lock()
+
+# negative cache of repositories github reported as not found, so retries
+# of a misspelled name do not hit the network. least recently used entries
+# are evicted first.
+# (owner, repo) -> expires_at
+_GITHUB_NOT_FOUND_TTL = 300.0
+_GITHUB_NOT_FOUND_MAX_ENTRIES = 1024
+_GITHUB_NOT_FOUND: OrderedDict[Tuple[str, str], float] = OrderedDict()
+
+
 # ---------------------------------------------------------------------
-def _configure_loguru(log_level: str = "INFO") -> None:
-    """configure global loguru logging.
+# Helper functions
+# ---------------------------------------------------------------------
+class ValidationResult(NamedTuple):
+    """outcome of a single validation check.
+
+    Attributes
+    ----------
+    valid : bool
+        whether the check passed
+    message : str
+        human readable description of the outcome
+    data : Dict[str, Any], optional
+        payload returned by the check, e.g. github repository metadata
+    """
+
+    valid: bool
+    message: str
+    data: Optional[Dict[str, Any]] = None
+
+
+async def _validate_github_repo(owner: str, repo: str) -> ValidationResult:
+    """validate if a github repository exists.
+
+    successful lookups are cached for a short time and revalidated with
+    the stored ETag, and repositories reported as not found are remembered
+    for a few minutes, so repeated calls for the same repository are cheap.
 
     Parameters
     ----------
-    log_level : str, optional
-        minimum log level for emitted logs. typical values are "DEBUG",
-        "INFO", "WARNING", and "ERROR". default is "INFO".
+    owner : str
+        repository owner username or organization name
+    repo : str
+        repository name
+
+    Returns
+    -------
+    ValidationResult
+        whether the check passed, with a message
     """
-    logging.basicConfig(stream=sys.stderr, level=logging.WARNING)
-    logger.remove()
-    logger.add(
-        sys.stderr,
-        level=log_level,
-        enqueue=True,
-        backtrace=False,
-        diagnose=False,
-        format=(
-            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> "
-            "| <level>{level: <8}</level> "
-            "| <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> "
-            "- <level>{message}</level>"
-        ),
-    )
+    key = (owner, repo)
+    now = time.monotonic()
+    with _GITHUB_CACHE_LOCK:
+        not_found_until = _GITHUB_NOT_FOUND.get(key)
+        if not_found_until is not None:
+            if now < not_found_until:
+                _GITHUB_NOT_FOUND.move_to_end(key)
+                return ValidationResult(False, f"repository {owner}/{repo} not found")
+            del _GITHUB_NOT_FOUND[key]
+        cached = _GITHUB_CACHE.get(key)
+        if cached is not None:
+            _GITHUB_CACHE.move_to_end(key)
+    if cached is not None and now < cached[0]:
+        return cached[1]
 
+    api_url = f"https://api.github.com/repos/{owner}/{repo}"
+    headers = {}
+    if cached is not None and cached[2] is not None:
+        headers["If-None-Match"] = cached[2]
 
-class _InterceptHandler(logging.Handler):
-    """bridge standard logging records into loguru.
+    try:
+        response = await _HTTP.get(api_url, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            # unchanged since last fetch, only refresh the expiry
+            with _GITHUB_CACHE_LOCK:
+                _GITHUB_CACHE[key] = (
+                    time.monotonic() + _GITHUB_CACHE_TTL,
+                    cached[1],
+                    cached[2],
+                )
+            return cached[1]
+        elif response.status_code == 200:
+            result = ValidationResult(
+                True,
+                f"repository {owner}/{repo} exists",
+                data=response.json(),
+            )
+            with _GITHUB_CACHE_LOCK:
+                _GITHUB_CACHE[key] = (
+                    time.monotonic() + _GITHUB_CACHE_TTL,
+                    result,
+                    response.headers.get("ETag"),
+                )
+                _GITHUB_CACHE.move_to_end(key)
+                if len(_GITHUB_CACHE) > _GITHUB_CACHE_MAX_ENTRIES:
+                    _GITHUB_CACHE.popitem(last=False)
+                _GITHUB_NOT_FOUND.pop(key, None)
+            return result
+        elif response.status_code == 404:
+            with _GITHUB_CACHE_LOCK:
+                _GITHUB_CACHE.pop(key, None)
+                _GITHUB_NOT_FOUND[key] = time.monotonic() + _GITHUB_NOT_FOUND_TTL
+                _GITHUB_NOT_FOUND.move_to_end(key)
+                if len(_GITHUB_NOT_FOUND) > _GITHUB_NOT_FOUND_MAX_ENTRIES:
+                    _GITHUB_NOT_FOUND.popitem(last=False)
+            return ValidationResult(False, f"repository {owner}/{repo} not found")
+        else:
+            return ValidationResult(
+                False,
+                f"unexpected status code {response.status_code} for {owner}/{repo}",
+            )
+    except httpx.HTTPError as e:
+        return ValidationResult(False, f"failed to validate repository: {str(e)}")
+
+
+async def _validate_remote_branch(repo_url: str, branch: str) -> ValidationResult:
+    """validate that a remote repository and branch exist via git ls-remote.
+
+    Parameters
+    ----------
+    repo_url : str
+        git URL of the remote repository
+    branch : str
+        branch name expected to exist on the remote
 
-    this handler can be attached to the root logging logger so that log
-    messages emitted by FastMCP (which uses `logging`) are forwarded to
-    loguru.
+    Returns
+    -------
+    ValidationResult
+        whether the check passed, with a message
     """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            "ls-remote",
+            "--exit-code",
+            "--heads",
+            repo_url,
+            f"refs/heads/{branch}",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            env=_GIT_ENV,
+        )
+    except FileNotFoundError:
+        return ValidationResult(
+            False,
+            "git command not found. please ensure git is installed and in PATH",
+        )
 
-    def emit(self, record: logging.LogRecord) -> None:
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = "INFO"
-        logger.opt(depth=6, exception=record.exc_info).log(level, record.getMessage())
+    try:
+        _, stderr = await asyncio.wait_for(
+            proc.communicate(), timeout=_LS_REMOTE_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        await _kill(proc)
+        return ValidationResult(False, f"timed out while checking {repo_url}")
+    except asyncio.CancelledError:
+        await _kill(proc)
+        raise
+
+    if proc.returncode == 0:
+        return ValidationResult(True, f"branch {branch} exists in {repo_url}")
+    elif proc.returncode == 2:
+        return ValidationResult(False, f"branch {branch} not found in {repo_url}")
+    else:
+        return ValidationResult(
+            False,
+            (
+                f"repository {repo_url} not found or not accessible: "
+                f"{stderr.decode('utf-8', 'replace').strip()}"
+            ),
+        )
 
 
-def _configure_standard_logging() -> None:
-    """configure standard logging to route through loguru.
+async def _kill(proc: asyncio.subprocess.Process, target: Optional[Path] = None) -> None:
+    """kill a git subprocess and wait for it to exit.
 
-    this allows FastMCP's internal logging (which uses the standard
-    `logging` module) to appear in the same log stream as user logs
-    emitted via loguru.
+    Parameters
+    ----------
+    proc : asyncio.subprocess.Process
+        running git process
+    target : Path, optional
+        clone target directory. a killed clone leaves it partially written,
+        so it is removed once the process has exited. it did not exist
+        before the clone, see `_validate_target_directory`.
     """
-    logging.root.handlers = []
-    logging.root.setLevel(logging.INFO)
-    logging.root.addHandler(_InterceptHandler())
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        pass
+    await proc.wait()
+    if target is not None:
+        await asyncio.to_thread(shutil.rmtree, target, ignore_errors=True)
 
 
-# ---------------------------------------------------------------------
-# MCP server and engine wiring
-# ---------------------------------------------------------------------
-mcp = FastMCP("git-clone-mcp-server", json_response=True)
+async def _read_tail(
+    stream: asyncio.StreamReader, max_lines: int = _GIT_OUTPUT_TAIL_LINES
+) -> str:
+    """read a subprocess stream to EOF, keeping only its last lines.
 
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        stdout or stderr pipe of the subprocess
+    max_lines : int, optional
+        number of trailing lines to keep, defaults to 64
 
-# ---------------------------------------------------------------------
-# Helper functions
-# ---------------------------------------------------------------------
-def _validate_github_repo(owner: str, repo: str) -> Dict[str, Any]:
-    """validate if a github repository exists.
+    Returns
+    -------
+    str
+        the last `max_lines` lines of the stream, decoded as utf-8
+    """
+    tail: Deque[bytes] = deque(maxlen=max_lines)
+    pending = b""
+    while chunk := await stream.read(65536):
+        # git progress output separates updates with carriage returns
+        lines = (pending + chunk.replace(b"\r", b"\n")).split(b"\n")
+        pending = lines.pop()
+        tail.extend(line for line in lines if line)
+    if pending:
+        tail.append(pending)
+    return b"\n".join(tail).decode("utf-8", "replace")
+
+
+def _writable_from_mode(st: os.stat_result) -> bool:
+    """check whether stat mode bits alone prove a directory is writable.
+
+    creating an entry needs both write and search permission. a false result
+    is not conclusive (acls, root, capabilities), so callers fall back to
+    `os.access` in that case.
 
     Parameters
     ----------
-    owner : str
-        repository owner username or organization name
-    repo : str
-        repository name
+    st : os.stat_result
+        stat result of the directory
 
     Returns
     -------
-    Dict[str, Any]
-        dictionary with 'valid' (bool) and 'message' (str) keys
+    bool
+        True if the owner, group or other bits grant write and search access
     """
-    api_url = f"https://api.github.com/repos/{owner}/{repo}"
+    mode = st.st_mode
+    if st.st_uid == _EUID:
+        return mode & (stat.S_IWUSR | stat.S_IXUSR) == stat.S_IWUSR | stat.S_IXUSR
+    if st.st_gid in _GIDS:
+        return mode & (stat.S_IWGRP | stat.S_IXGRP) == stat.S_IWGRP | stat.S_IXGRP
+    return mode & (stat.S_IWOTH | stat.S_IXOTH) == stat.S_IWOTH | stat.S_IXOTH
 
-    try:
-        response = requests.get(api_url, timeout=10)
 
-        if response.status_code == 200:
-            return {
-                "valid": True,
-                "message": f"repository {owner}/{repo} exists",
-                "data": response.json(),
-            }
-        elif response.status_code == 404:
-            return {"valid": False, "message": f"repository {owner}/{repo} not found"}
-        else:
-            return {
-                "valid": False,
-                "message": f"unexpected status code {response.status_code} for {owner}/{repo}",
-            }
-    except requests.exceptions.RequestException as e:
-        return {"valid": False, "message": f"failed to validate repository: {str(e)}"}
+def _check_parent_directory(parent_dir: Path) -> Tuple[bool, bool]:
+    """check whether a parent directory is a directory and writable.
+
+    results are cached for a short time, keyed by the parent path.
 
+    Parameters
+    ----------
+    parent_dir : Path
+        parent directory of the clone target
 
-def _validate_target_directory(target_path: str) -> Dict[str, Any]:
+    Returns
+    -------
+    Tuple[bool, bool]
+        whether `parent_dir` is a directory and whether it is writable
+
+    Raises
+    ------
+    OSError
+        if `parent_dir` cannot be stat-ed (e.g. it does not exist)
+    """
+    key = str(parent_dir)
+    now = time.monotonic()
+    cached = _PARENT_CACHE.get(key)
+    if cached is not None and now < cached[0]:
+        return cached[1], cached[2]
+
+    parent_stat = os.stat(parent_dir)
+    is_dir = stat.S_ISDIR(parent_stat.st_mode)
+    writable = is_dir and (
+        _writable_from_mode(parent_stat) or os.access(parent_dir, os.W_OK)
+    )
+
+    if len(_PARENT_CACHE) >= _PARENT_CACHE_MAX_ENTRIES:
+        _PARENT_CACHE.clear()
+    _PARENT_CACHE[key] = (now + _PARENT_CACHE_TTL, is_dir, writable)
+    return is_dir, writable
+
+
+def _validate_target_directory(target: Path, parent_dir: Path) -> ValidationResult:
     """validate if the target directory path is valid.
 
     Parameters
     ----------
-    target_path : str
+    target : Path
         path to the target directory where repo will be cloned
+    parent_dir : Path
+        parent directory of `target`
 
     Returns
     -------
-    Dict[str, Any]
-        dictionary with 'valid' (bool) and 'message' (str) keys
+    ValidationResult
+        whether the check passed, with a message
     """
-    path_obj = Path(target_path)
-
-    # check if parent directory exists
-    parent_dir = path_obj.parent
-    if not parent_dir.exists():
-        return {
-            "valid": False,
-            "message": f"parent directory {parent_dir} does not exist",
-        }
+    # check if parent directory exists and is a directory
+    try:
+        is_dir, writable = _check_parent_directory(parent_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return ValidationResult(False, f"parent directory {parent_dir} does not exist")
+    except OSError as e:
+        return ValidationResult(
+            False, f"cannot access parent directory {parent_dir}: {str(e)}"
+        )
 
-    # check if parent is a directory
-    if not parent_dir.is_dir():
-        return {
-            "valid": False,
-            "message": f"parent path {parent_dir} is not a directory",
-        }
+    if not is_dir:
+        return ValidationResult(False, f"parent path {parent_dir} is not a directory")
 
-    # check if target path already exists
-    if path_obj.exists():
-        return {"valid": False, "message": f"target path {target_path} already exists"}
+    # check if target path already exists (never cached, lstat only)
+    if os.path.lexists(target):
+        return ValidationResult(False, f"target path {target} already exists")
 
     # check if parent directory is writable
-    if not os.access(parent_dir, os.W_OK):
-        return {
-            "valid": False,
-            "message": f"no write permission for parent directory {parent_dir}",
-        }
+    if not writable:
+        return ValidationResult(
+            False, f"no write permission for parent directory {parent_dir}"
+        )
 
-    return {"valid": True, "message": f"target path {target_path} is valid"}
+    return ValidationResult(True, f"target path {target} is valid")
 
 
 # ---------------------------------------------------------------------
 # MCP tools
 # ---------------------------------------------------------------------
-@mcp.tool
 async def clone_github_repo(
-    repo_name: str, target_path: str, branch: str = "main"
+    repo_name: str,
+    target_path: str,
+    branch: str = "main",
+    depth: Optional[int] = 1,
+    partial: bool = True,
+    validate: bool = False,
+    include_metadata: bool = False,
 ) -> Dict[str, Any]:
     """clone a public github repository to a specified local directory.
 
@@ -179,12 +443,29 @@ async def clone_github_repo(
         absolute or relative path where the repository should be cloned
     branch : str, optional
         branch name to clone, defaults to "main"
+    depth : int, optional
+        history depth to fetch, defaults to 1. pass None for full history.
+    partial : bool, optional
+        skip downloading file contents not needed for the checkout
+        (``--filter=blob:none``), defaults to True.
+    validate : bool, optional
+        check that the repository and branch exist with ``git ls-remote``
+        before cloning, defaults to False. git clone already fails fast on
+        a missing repository or branch.
+    include_metadata : bool, optional
+        query the github API and include the repository metadata in the
+        response, defaults to False.
     """
-    logger.info(f"attempting to clone {repo_name} (branch: {branch}) to {target_path}")
+    # lexical normalisation only (no symlink resolution), so equivalent
+    # spellings of the same path share cache entries downstream.
+    target_path = os.path.normpath(target_path)
+    logger.info(
+        "attempting to clone {} (branch: {}) to {}", repo_name, branch, target_path
+    )
 
     # parse repo_name into owner and repo
-    parts = repo_name.split("/")
-    if len(parts) != 2:
+    match = _REPO_RE.match(repo_name)
+    if match is None:
         error_msg = (
             f"invalid repo_name format: {repo_name}. expected format: owner/repo"
         )
@@ -196,78 +477,124 @@ async def clone_github_repo(
             "branch": branch,
         }
 
-    owner, repo = parts
+    owner, repo = match.groups()
 
-    # validate github repository
-    logger.debug(f"validating github repository {owner}/{repo}")
-    repo_validation = _validate_github_repo(owner, repo)
-    if not repo_validation["valid"]:
-        logger.error(f"repository validation failed: {repo_validation['message']}")
+    if _BRANCH_RE.match(branch) is None:
+        error_msg = f"invalid branch name: {branch}"
+        logger.error(error_msg)
         return {
             "success": False,
-            "message": repo_validation["message"],
+            "message": error_msg,
             "repo_path": None,
             "branch": branch,
         }
 
-    logger.info(f"repository {owner}/{repo} validated successfully")
+    target = Path(target_path)
+    parent_dir = target.parent
+
+    # construct github URL
+    repo_url = f"https://github.com/{owner}/{repo}.git"
 
-    # validate target directory
-    logger.debug(f"validating target directory: {target_path}")
-    dir_validation = _validate_target_directory(target_path)
-    if not dir_validation["valid"]:
-        logger.error(f"directory validation failed: {dir_validation['message']}")
+    # remote checks are opt-in, the target directory is always validated.
+    # all requested checks run concurrently.
+    logger.debug("validating target directory: {}", target_path)
+    checks = [asyncio.to_thread(_validate_target_directory, target, parent_dir)]
+    if validate:
+        logger.debug("validating remote branch {} of {}", branch, repo_url)
+        checks.append(_validate_remote_branch(repo_url, branch))
+    if include_metadata:
+        logger.debug("validating github repository {}/{}", owner, repo)
+        checks.append(_validate_github_repo(owner, repo))
+    dir_validation, *repo_validations = await asyncio.gather(*checks)
+
+    for repo_validation in repo_validations:
+        if not repo_validation.valid:
+            logger.error("repository validation failed: {}", repo_validation.message)
+            return {
+                "success": False,
+                "message": repo_validation.message,
+                "repo_path": None,
+                "branch": branch,
+            }
+
+    if repo_validations:
+        logger.info("repository {}/{} validated successfully", owner, repo)
+
+    if not dir_validation.valid:
+        logger.error("directory validation failed: {}", dir_validation.message)
         return {
             "success": False,
-            "message": dir_validation["message"],
+            "message": dir_validation.message,
             "repo_path": None,
             "branch": branch,
         }
 
-    logger.info(f"target directory {target_path} validated successfully")
+    logger.info("target directory {} validated successfully", target_path)
 
-    # construct github URL
-    repo_url = f"https://github.com/{owner}/{repo}.git"
+    # build git clone command
+    cmd = ["git", "clone", "--single-branch"]
+    if depth is not None:
+        cmd += ["--depth", str(depth)]
+    if partial:
+        cmd.append("--filter=blob:none")
+    cmd += ["--branch", branch, repo_url, target_path]
 
     # execute git clone command
     try:
-        logger.info(f"executing git clone from {repo_url}")
-        result = subprocess.run(
-            ["git", "clone", "--branch", branch, repo_url, target_path],
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
+        logger.info("executing git clone from {}", repo_url)
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=_GIT_ENV,
         )
+        try:
+            git_output, git_error, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    _read_tail(proc.stdout), _read_tail(proc.stderr), proc.wait()
+                ),
+                timeout=_CLONE_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            await _kill(proc, target)
+            error_msg = "git clone timed out."
+            logger.error(error_msg)
+            return {
+                "success": False,
+                "message": error_msg,
+                "repo_path": None,
+                "branch": branch,
+            }
+        except asyncio.CancelledError:
+            # e.g. a cancelled tool call, or a sibling failing in a batch
+            logger.warning("git clone of {} cancelled", repo_url)
+            await _kill(proc, target)
+            raise
+
+        if proc.returncode != 0:
+            error_msg = f"git clone failed: {git_error}"
+            logger.error(error_msg)
+            return {
+                "success": False,
+                "message": error_msg,
+                "repo_path": None,
+                "branch": branch,
+                "git_error": git_error,
+            }
 
-        logger.info(f"successfully cloned {repo_name} to {target_path}")
-        return {
+        logger.info("successfully cloned {} to {}", repo_name, target_path)
+        result = {
             "success": True,
             "message": f"successfully cloned {repo_name} (branch: {branch}) to {target_path}",
-            "repo_path": str(Path(target_path).resolve()),
+            # resolve only the parent, the clone itself is a plain directory
+            "repo_path": str(parent_dir.resolve() / target.name),
             "branch": branch,
-            "git_output": result.stdout,
+            "git_output": git_output,
         }
+        if include_metadata:
+            result["repo_metadata"] = repo_validations[-1].data
+        return result
 
-    except subprocess.CalledProcessError as e:
-        error_msg = f"git clone failed: {e.stderr}"
-        logger.error(error_msg)
-        return {
-            "success": False,
-            "message": error_msg,
-            "repo_path": None,
-            "branch": branch,
-            "git_error": e.stderr,
-        }
-    except subprocess.TimeoutExpired:
-        error_msg = "git clone timed out."
-        logger.error(error_msg)
-        return {
-            "success": False,
-            "message": error_msg,
-            "repo_path": None,
-            "branch": branch,
-        }
     except FileNotFoundError:
         error_msg = "git command not found. please ensure git is installed and in PATH"
         logger.error(error_msg)
@@ -288,6 +615,122 @@ async def clone_github_repo(
         }
 
 
+class _CloneTarget(TypedDict):
+    """required keys of a `CloneRequest`."""
+
+    repo_name: str
+    target_path: str
+
+
+class CloneRequest(_CloneTarget, total=False):
+    """one repository to clone with `clone_github_repos`.
+
+    Attributes
+    ----------
+    repo_name : str
+        github repository in the format "owner/repo"
+    target_path : str
+        local directory path where the repository should be cloned
+    branch : str, optional
+        branch to clone, defaults to "main"
+    """
+
+    branch: str
+
+
+async def clone_github_repos(
+    requests: List[CloneRequest],
+    max_parallel: int = _MAX_PARALLEL_CLONES,
+) -> List[Dict[str, Any]]:
+    """clone several public github repositories concurrently.
+
+    Parameters
+    ----------
+    requests : List[CloneRequest]
+        one entry per repository, with its "repo_name", "target_path" and
+        optionally "branch"
+    max_parallel : int, optional
+        maximum number of clones running at the same time, defaults to about
+        three quarters of the available cpus (at least 3)
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        one `clone_github_repo` result per request, in the same order
+    """
+    max_parallel = max(1, max_parallel)
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def clone_one(request: CloneRequest) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await clone_github_repo(**request)
+            except Exception as e:
+                error_msg = f"invalid clone request {request!r}: {str(e)}"
+                logger.error(error_msg)
+                return {
+                    "success": False,
+                    "message": error_msg,
+                    "repo_path": None,
+                    "branch": request.get("branch", "main"),
+                }
+
+    logger.info("cloning {} repositories, {} at a time", len(requests), max_parallel)
+    return list(await asyncio.gather(*(clone_one(r) for r in requests)))
+
+
+# ---------------------------------------------------------------------
+# MCP server
+# ---------------------------------------------------------------------
+_MCP: Optional[FastMCP] = None
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """close the shared HTTP client when the server shuts down.
+
+    Parameters
+    ----------
+    server : FastMCP
+        the server being run
+    """
+    try:
+        yield
+    finally:
+        await _HTTP.aclose()
+
+
+def _get_server() -> FastMCP:
+    """create the MCP server and register its tools.
+
+    fastmcp is imported here rather than at module level since it is slow
+    to import, which keeps ``--help`` and plain imports of this module fast.
+    the server is created once and reused.
+
+    Returns
+    -------
+    FastMCP
+        configured MCP server.
+    """
+    global _MCP
+    if _MCP is None:
+        from fastmcp import FastMCP
+
+        _MCP = FastMCP(
+            "git-clone-mcp-server", json_response=True, lifespan=_lifespan
+        )
+        _MCP.tool(clone_github_repo)
+        _MCP.tool(clone_github_repos)
+    return _MCP
+
+
+def __getattr__(name: str) -> Any:
+    """lazily expose the MCP server as the module attribute ``mcp``."""
+    if name == "mcp":
+        return _get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # ---------------------------------------------------------------------
 # Entrypoint
 # ---------------------------------------------------------------------
@@ -338,8 +781,15 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    _configure_loguru(log_level=args.log_level)
-    _configure_standard_logging()
+    # the shared logging setup lives next to the server directories
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from mcp_common.logging import configure as configure_logging
+
+    configure_logging(args.log_level)
+
+    from fastmcp.utilities.logging import get_logger as get_fastmcp_logger
+
+    mcp = _get_server()
 
     fmcp_logger = get_fastmcp_logger("server")
     fmcp_logger.info("starting git clone MCP server")
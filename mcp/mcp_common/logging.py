@@ -0,0 +1,103 @@
+# logging.py
+"""Logging setup shared by the MCP servers.
+
+Both servers log through loguru and bridge the standard `logging` module
+(used by FastMCP) into the same sink, so the configuration lives here.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+
+from loguru import logger
+
+__all__ = ["InterceptHandler", "configure"]
+
+_COLOR_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> "
+    "| <level>{level: <8}</level> "
+    "| <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> "
+    "- <level>{message}</level>"
+)
+
+# Same layout without markup, used when stderr is piped (e.g. stdio MCP
+# clients or containers).
+_PLAIN_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+)
+
+
+class InterceptHandler(logging.Handler):
+    """Bridge standard logging records into loguru.
+
+    This handler can be attached to the root logging logger so that log
+    messages emitted by FastMCP (which uses `logging`) are forwarded to
+    loguru.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            level = logger.level(record.levelname).name
+        except ValueError:
+            level = "INFO"
+        logger.opt(depth=6, exception=record.exc_info).log(level, record.getMessage())
+
+
+def _configure_loguru(log_level: str = "INFO") -> None:
+    """Configure global loguru logging.
+
+    Parameters
+    ----------
+    log_level : str, optional
+        Minimum log level for emitted logs. Typical values are ``"DEBUG"``,
+        ``"INFO"``, ``"WARNING"``, and ``"ERROR"``. Default is ``"INFO"``.
+    """
+    logging.basicConfig(stream=sys.stderr, level=logging.WARNING)
+    logger.remove()
+    # Colour markup is only worth parsing when a terminal will render it.
+    colorize = sys.stderr.isatty()
+    logger.add(
+        sys.stderr,
+        level=log_level,
+        enqueue=False,
+        backtrace=False,
+        diagnose=False,
+        colorize=colorize,
+        format=_COLOR_FORMAT if colorize else _PLAIN_FORMAT,
+    )
+
+
+def _configure_standard_logging(log_level: str = "INFO") -> None:
+    """Configure standard logging to route through loguru.
+
+    This allows FastMCP's internal logging (which uses the standard
+    `logging` module) to appear in the same log stream as user logs
+    emitted via loguru.
+
+    Parameters
+    ----------
+    log_level : str, optional
+        Log level of the servers' own loguru sink. Standard logging records,
+        which come from third-party libraries, are only forwarded from
+        ``WARNING`` up, or from `log_level` if it is higher, so a ``DEBUG``
+        sink does not receive every library's debug output. Records below
+        that are dropped by the standard logging level checks before
+        reaching the intercept handler. Default is ``"INFO"``.
+    """
+    level_no = max(logging.WARNING, logger.level(log_level).no)
+    logging.root.handlers = []
+    logging.root.setLevel(level_no)
+    logging.root.addHandler(InterceptHandler(level=level_no))
+
+
+def configure(log_level: str = "INFO") -> None:
+    """Configure loguru and route standard logging through it.
+
+    Parameters
+    ----------
+    log_level : str, optional
+        Minimum log level for emitted logs. Default is ``"INFO"``.
+    """
+    _configure_loguru(log_level)
+    _configure_standard_logging(log_level)
@@ -2,86 +2,39 @@
 from __future__ import annotations
 
 import argparse
-import logging
+import asyncio
+import functools
 import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar
 
-from fastmcp import FastMCP
-from fastmcp.utilities.logging import get_logger as get_fastmcp_logger
 from loguru import logger
-from src.engine import LSPEngine
+from src.engine import DEFAULT_CACHE_DIR, LSPEngine
 
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
-# ---------------------------------------------------------------------
-# Logging configuration
-# ---------------------------------------------------------------------
-def _configure_loguru(log_level: str = "INFO") -> None:
-    """Configure global loguru logging.
-
-    Parameters
-    ----------
-    log_level : str, optional
-        Minimum log level for emitted logs. Typical values are ``"DEBUG"``,
-        ``"INFO"``, ``"WARNING"``, and ``"ERROR"``. Default is ``"INFO"``.
-    """
-    logging.basicConfig(stream=sys.stderr, level=logging.WARNING)
-    logger.remove()
-    logger.add(
-        sys.stderr,
-        level=log_level,
-        enqueue=True,
-        backtrace=False,
-        diagnose=False,
-        format=(
-            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> "
-            "| <level>{level: <8}</level> "
-            "| <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> "
-            "- <level>{message}</level>"
-        ),
-    )
-
-
-class _InterceptHandler(logging.Handler):
-    """Bridge standard logging records into loguru.
-
-    This handler can be attached to the root logging logger so that log
-    messages emitted by FastMCP (which uses `logging`) are forwarded to
-    loguru.
-    """
-
-    def emit(self, record: logging.LogRecord) -> None:
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = "INFO"
-        logger.opt(depth=6, exception=record.exc_info).log(level, record.getMessage())
-
-
-def _configure_standard_logging() -> None:
-    """Configure standard logging to route through loguru.
-
-    This allows FastMCP's internal logging (which uses the standard
-    `logging` module) to appear in the same log stream as user logs
-    emitted via loguru.
-    """
-    logging.root.handlers = []
-    logging.root.setLevel(logging.INFO)
-    logging.root.addHandler(_InterceptHandler())
+T = TypeVar("T")
 
 
 # ---------------------------------------------------------------------
 # MCP server and engine wiring
 # ---------------------------------------------------------------------
-mcp = FastMCP("python-lsp-mcp-server", json_response=True)
+# Thread pool running engine construction and queries, so that parsing and
+# lazy indexing never block the event loop.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 4), thread_name_prefix="lsp-engine"
+)
 
-# Global engine instance, initialised in `main`.
-_ENGINE: Optional[LSPEngine] = None
+# Global engine future. The engine is built in the background from `main`
+# so that indexing overlaps with MCP transport setup.
+_ENGINE_FUTURE: Optional[Future[LSPEngine]] = None
 
 
-def _get_engine() -> LSPEngine:
-    """Return the global LSPEngine instance.
+async def _get_engine() -> LSPEngine:
+    """Return the global LSPEngine instance, waiting for it to finish indexing.
 
     Returns
     -------
@@ -94,15 +47,33 @@ def _get_engine() -> LSPEngine:
         If the engine has not been initialised. This should not occur if
         `main()` has been executed prior to starting the MCP server.
     """
-    if _ENGINE is None:
+    if _ENGINE_FUTURE is None:
         raise RuntimeError("LSPEngine not initialised. Did you run main()?")
-    return _ENGINE
+    return await asyncio.wrap_future(_ENGINE_FUTURE)
+
+
+async def _run_in_executor(func: Callable[..., T], /, **kwargs: Any) -> T:
+    """Run a blocking engine call in the engine thread pool.
+
+    Parameters
+    ----------
+    func : callable
+        Engine method to call.
+    **kwargs
+        Keyword arguments forwarded to `func`.
+
+    Returns
+    -------
+    Any
+        Return value of `func`.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, functools.partial(func, **kwargs))
 
 
 # ---------------------------------------------------------------------
 # MCP tools
 # ---------------------------------------------------------------------
-@mcp.tool
 async def definition_short(
     symbol: Optional[str] = None,
     file_path: Optional[str] = None,
@@ -119,16 +90,18 @@ async def definition_short(
     max_chars : int, optional
         Maximum docstring length (default: 1000).
     """
-    engine = _get_engine()
+    engine = await _get_engine()
     logger.info(
         "definition_short called with symbol={!r}, file_path={!r}", symbol, file_path
     )
-    return engine.get_definition_short(
-        symbol=symbol, file_path=file_path, max_chars=max_chars
+    return await _run_in_executor(
+        engine.get_definition_short,
+        symbol=symbol,
+        file_path=file_path,
+        max_chars=max_chars,
     )
 
 
-@mcp.tool
 async def definition_full(
     symbol: Optional[str] = None,
     file_path: Optional[str] = None,
@@ -145,16 +118,18 @@ async def definition_full(
     max_chars : int, optional
         Maximum source length (default: 5000).
     """
-    engine = _get_engine()
+    engine = await _get_engine()
     logger.info(
         "definition_full called with symbol={!r}, file_path={!r}", symbol, file_path
     )
-    return engine.get_definition_full(
-        symbol=symbol, file_path=file_path, max_chars=max_chars
+    return await _run_in_executor(
+        engine.get_definition_full,
+        symbol=symbol,
+        file_path=file_path,
+        max_chars=max_chars,
     )
 
 
-@mcp.tool
 async def outline(
     symbol: Optional[str] = None,
     file_path: Optional[str] = None,
@@ -171,12 +146,13 @@ async def outline(
     max_chars : int, optional
         Maximum docstring length (default: 1000).
     """
-    engine = _get_engine()
+    engine = await _get_engine()
     logger.info("outline called with symbol={!r}, file_path={!r}", symbol, file_path)
-    return engine.get_outline(symbol=symbol, file_path=file_path, max_chars=max_chars)
+    return await _run_in_executor(
+        engine.get_outline, symbol=symbol, file_path=file_path, max_chars=max_chars
+    )
 
 
-@mcp.tool
 async def references(
     symbol: Optional[str] = None,
     file_path: Optional[str] = None,
@@ -193,14 +169,13 @@ async def references(
     max_chars : int, optional
         Maximum context length (default: 300).
     """
-    engine = _get_engine()
+    engine = await _get_engine()
     logger.info("references called with symbol={!r}, file_path={!r}", symbol, file_path)
-    return engine.get_references(
-        symbol=symbol, file_path=file_path, max_chars=max_chars
+    return await _run_in_executor(
+        engine.get_references, symbol=symbol, file_path=file_path, max_chars=max_chars
     )
 
 
-@mcp.tool
 async def filter_symbols(
     name: Optional[str] = None,
     kind: Optional[str] = None,
@@ -223,14 +198,15 @@ async def filter_symbols(
     max_chars : int, optional
         Maximum docstring length (default: 500).
     """
-    engine = _get_engine()
+    engine = await _get_engine()
     logger.info(
         "filter_symbols called with name={!r}, kind={!r}, type_hint={!r}",
         name,
         kind,
         type_hint,
     )
-    return engine.filter_symbols(
+    return await _run_in_executor(
+        engine.filter_symbols,
         name=name,
         kind=kind,
         type_hint=type_hint,
@@ -239,6 +215,44 @@ async def filter_symbols(
     )
 
 
+# ---------------------------------------------------------------------
+# MCP server
+# ---------------------------------------------------------------------
+_MCP: Optional[FastMCP] = None
+
+
+def _get_server() -> FastMCP:
+    """Create the MCP server and register its tools.
+
+    FastMCP is imported here rather than at module level since it is slow
+    to import, which keeps ``--help`` and plain imports of this module fast.
+    The server is created once and reused.
+
+    Returns
+    -------
+    FastMCP
+        Configured MCP server.
+    """
+    global _MCP
+    if _MCP is None:
+        from fastmcp import FastMCP
+
+        _MCP = FastMCP("python-lsp-mcp-server", json_response=True)
+        _MCP.tool(definition_short)
+        _MCP.tool(definition_full)
+        _MCP.tool(outline)
+        _MCP.tool(references)
+        _MCP.tool(filter_symbols)
+    return _MCP
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily expose the MCP server as the module attribute ``mcp``."""
+    if name == "mcp":
+        return _get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # ---------------------------------------------------------------------
 # Entrypoint
 # ---------------------------------------------------------------------
@@ -288,6 +302,17 @@ def main() -> None:
         default=8000,
         help="Port for HTTP transport.",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        nargs="?",
+        const=str(DEFAULT_CACHE_DIR),
+        default=None,
+        help=(
+            "Enable the on-disk parse cache, in the given directory or in "
+            f"{DEFAULT_CACHE_DIR} if none is given."
+        ),
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -296,17 +321,27 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    _configure_loguru(log_level=args.log_level)
-    _configure_standard_logging()
+    # The shared logging setup lives next to the server directories.
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from mcp_common.logging import configure as configure_logging
+
+    configure_logging(args.log_level)
+
+    # Start indexing before importing fastmcp so the two overlap.
+    global _ENGINE_FUTURE
+    _ENGINE_FUTURE = _EXECUTOR.submit(
+        LSPEngine, project_root=Path(args.project_root), cache_dir=args.cache_dir
+    )
+
+    from fastmcp.utilities.logging import get_logger as get_fastmcp_logger
+
+    mcp = _get_server()
 
     # Optional: get a FastMCP logger (routes through std logging, which we already
     # bridged to loguru). You can use it if you want namespaced logs.
     fmcp_logger = get_fastmcp_logger("server")
     fmcp_logger.info("Starting Python LSP MCP server")
 
-    global _ENGINE
-    _ENGINE = LSPEngine(project_root=Path(args.project_root))
-
     if args.transport == "streamable-http":
         logger.info(
             "Running MCP server with HTTP transport on {}:{}",
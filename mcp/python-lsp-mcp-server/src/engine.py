@@ -1,12 +1,438 @@
 # engine.py
 from __future__ import annotations
 
-from parser import OutlineNode, SymbolDefinition, SymbolReference, parse_python_file
+import bisect
+import functools
+import hashlib
+import heapq
+import inspect
+import itertools
+import json
+import os
+import pickle
+import queue
+import re
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from operator import itemgetter
+from parser import (
+    OutlineNode,
+    SymbolDefinition,
+    SymbolReference,
+    parse_python_file,
+    parse_python_files,
+)
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 MAX_CHARS_HARD_LIMIT = 1500
 
+# Maximum number of entries in the resolved query path cache.
+_RESOLVE_CACHE_MAX_ENTRIES = 4096
+
+# Maximum number of memoized definition query results.
+_DEFINITION_CACHE_MAX_ENTRIES = 1024
+
+# Maximum number of entries kept in the on-disk parse cache.
+_PARSE_CACHE_MAX_ENTRIES = 20_000
+
+# Marks a definition query result missing from the cache, since ``None``
+# results are cached too.
+_MISSING = object()
+
+# Files per worker process below which eager indexing runs in fewer workers.
+_PARALLEL_CHUNKSIZE = 8
+
+# Seconds a symbol query waits for the background worker before parsing the
+# likeliest files itself.
+_SYMBOL_WAIT_TIMEOUT = 2.0
+
+
+def _truncate(text: Optional[str], max_chars: int, marker: str = "…") -> Optional[str]:
+    """Truncate a text field to a maximum length.
+
+    Parameters
+    ----------
+    text : str or None
+        Text to truncate.
+    max_chars : int
+        Maximum number of characters to keep.
+    marker : str, optional
+        Appended to truncated text. Default is ``"…"``.
+
+    Returns
+    -------
+    str or None
+        `text` unchanged if it is empty or short enough, otherwise its first
+        `max_chars` characters followed by `marker`.
+    """
+    if not text or len(text) <= max_chars:
+        return text
+    return text[:max_chars] + marker
+
+
+def _is_current(defn: SymbolDefinition) -> bool:
+    """Check whether a definition's file is unchanged since it was parsed.
+
+    Parameters
+    ----------
+    defn : SymbolDefinition
+        Indexed definition.
+
+    Returns
+    -------
+    bool
+        ``True`` if the file's modification time and size still match
+        ``defn.source_stamp``, so that its source span is valid.
+    """
+    try:
+        st = os.stat(defn.file_path)
+    except OSError:
+        return False
+    return (st.st_mtime_ns, st.st_size) == defn.source_stamp
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_docstring(text: str) -> str:
+    """Clean up the indentation of a docstring.
+
+    The parser keeps docstrings as written, so the cost of
+    :func:`inspect.cleandoc` is only paid for docstrings that are served,
+    once each.
+
+    Parameters
+    ----------
+    text : str
+        Raw docstring.
+
+    Returns
+    -------
+    str
+        Docstring as returned by ``ast.get_docstring(node, clean=True)``.
+    """
+    return inspect.cleandoc(text)
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON.
+
+    ``orjson`` is used when it is installed, and the standard library
+    encoder otherwise; both produce the same output for query results.
+
+    Parameters
+    ----------
+    obj : Any
+        JSON-serializable object.
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+ParseResult = Tuple[
+    OutlineNode, Dict[str, List[SymbolDefinition]], List[SymbolReference]
+]
+
+# Default location of the on-disk parse cache, when it is enabled.
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "lsp-engine"
+)
+
+# Cached parse results are only valid for the parser that produced them.
+_parser_stat = os.stat(parse_python_file.__code__.co_filename)
+_PARSER_STAMP = (_parser_stat.st_mtime_ns, _parser_stat.st_size)
+del _parser_stat
+
+
+def _parse_cache_path(cache_dir: Path, file_path: Path, project_root: Path) -> Path:
+    """Return the parse cache entry for a file.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path
+        Directory holding the parse cache.
+    file_path : pathlib.Path
+        Resolved path to the Python file.
+    project_root : pathlib.Path
+        Resolved project root. Qualified names depend on it, so it is part
+        of the key.
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the pickle file for `file_path`.
+    """
+    key = f"{project_root}\0{file_path}".encode("utf-8", "surrogateescape")
+    return cache_dir / (hashlib.sha1(key).hexdigest() + ".pkl")
+
+
+def _write_parse_cache(
+    cache_path: Path, stamp: Tuple[Any, ...], digest: Optional[bytes], parsed: Any
+) -> None:
+    """Atomically write a parse cache entry, ignoring failures.
+
+    Parameters
+    ----------
+    cache_path : pathlib.Path
+        Destination pickle file.
+    stamp : tuple
+        File and parser stamp the entry is valid for.
+    digest : bytes or None
+        SHA-256 digest of the file contents the entry was parsed from, if
+        it was computed.
+    parsed : tuple
+        Result of :func:`parse_python_file`.
+    """
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # The stamp and digest are written first so stale entries can be
+            # rejected without unpickling the parse result.
+            pickle.dump(stamp, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(digest, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError, RecursionError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _parse_file(
+    file_path: Path, project_root: Path, cache_dir: Optional[Path] = None
+) -> Optional[ParseResult]:
+    """Parse a single file, skipping files that no longer exist.
+
+    This is a module-level function so that it can run in worker processes.
+
+    Parameters
+    ----------
+    file_path : pathlib.Path
+        Resolved path to the Python file.
+    project_root : pathlib.Path
+        Resolved project root, used for module-qualified names.
+    cache_dir : pathlib.Path or None, optional
+        Directory of the on-disk parse cache. Entries are keyed by path and
+        checked against the file's modification time and size. When only
+        the modification time differs, the file is hashed and compared with
+        the hash stored at the previous such check, so files that keep being
+        touched (e.g. by checkouts) are not parsed again. ``None`` disables
+        the cache.
+
+    Returns
+    -------
+    tuple or None
+        Result of :func:`parse_python_file`, or ``None`` if the file does
+        not exist.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    if cache_dir is None:
+        return parse_python_file(file_path=file_path, project_root=project_root)
+
+    cache_path = _parse_cache_path(cache_dir, file_path, project_root)
+    stamp = (st.st_mtime_ns, st.st_size, _PARSER_STAMP, sys.version_info[:2])
+    digest: Optional[bytes] = None
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp = pickle.load(f)
+            if cached_stamp == stamp:
+                pickle.load(f)
+                parsed = pickle.load(f)
+                # Hits refresh the entry's age for pruning.
+                os.utime(cache_path)
+                return parsed
+            # Same parser and size but a different mtime: the contents may
+            # still be unchanged. Only then is the file hashed.
+            if cached_stamp[1:] == stamp[1:]:
+                with open(file_path, "rb") as src:
+                    digest = hashlib.sha256(src.read()).digest()
+                if pickle.load(f) == digest:
+                    parsed = pickle.load(f)
+                    # Source spans stay valid, for the new modification time.
+                    for defs in parsed[1].values():
+                        for defn in defs:
+                            defn.source_stamp = stamp[:2]
+                    _write_parse_cache(cache_path, stamp, digest, parsed)
+                    return parsed
+    except Exception:
+        # Missing, stale or corrupt entries are simply re-parsed.
+        pass
+
+    parsed = parse_python_file(file_path=file_path, project_root=project_root)
+    _write_parse_cache(cache_path, stamp, digest, parsed)
+    return parsed
+
+
+def _prune_parse_cache(cache_dir: Path, max_entries: int) -> None:
+    """Remove the least recently used parse cache entries beyond a limit.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path
+        Directory holding the parse cache.
+    max_entries : int
+        Number of entries to keep, by modification time. Hits refresh the
+        modification time of their entry.
+    """
+    entries: List[Tuple[float, str]] = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".pkl"):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - max_entries]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+# Splits identifiers and file stems into lowercase words, on separators and
+# camel case boundaries ("JSONDecoder" -> "json", "decoder").
+_NAME_TOKEN_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+
+def _name_tokens(name: str) -> List[str]:
+    """Split an identifier or file stem into lowercase words.
+
+    Parameters
+    ----------
+    name : str
+        Identifier, qualified name or file stem.
+
+    Returns
+    -------
+    list of str
+        Lowercase words of `name`.
+    """
+    return [token.lower() for token in _NAME_TOKEN_RE.findall(name)]
+
+
+def _substring_rows(buffer: str, starts: List[int], needle: str) -> Iterator[int]:
+    """Yield the rows of a joined buffer that contain a substring.
+
+    Parameters
+    ----------
+    buffer : str
+        Rows joined and terminated by ``"\\0"``.
+    starts : list of int
+        Offset of each row in `buffer`, followed by ``len(buffer)``.
+    needle : str
+        Non-empty substring to search for.
+
+    Yields
+    ------
+    int
+        Index of each matching row, in increasing order.
+    """
+    if "\0" in needle:
+        return
+    pos = buffer.find(needle)
+    while pos != -1:
+        row = bisect.bisect_right(starts, pos) - 1
+        yield row
+        # Skip the rest of the row, so each row is reported once.
+        pos = buffer.find(needle, starts[row + 1])
+
+
+# Directories never descended into during discovery: caches, VCS metadata,
+# virtual environments, vendored packages and build output. Hidden
+# directories are skipped as well.
+_SKIP_DIRS = frozenset(
+    {
+        "__pycache__",
+        ".git",
+        ".venv",
+        "venv",
+        "node_modules",
+        "site-packages",
+        ".tox",
+        "build",
+        "dist",
+    }
+)
+
+
+def _scan_python_files(directory: Path) -> Iterator[Tuple[Path, int]]:
+    """Yield Python files under a directory together with their sizes.
+
+    Directories are walked with :func:`os.scandir` in the same order as
+    ``Path.rglob("*.py")``: the files of a directory first, then each of its
+    subdirectories. Symlinked directories are not followed, and directories
+    in ``_SKIP_DIRS`` or starting with ``"."`` are pruned.
+
+    Parameters
+    ----------
+    directory : pathlib.Path
+        Resolved directory to walk.
+
+    Yields
+    ------
+    tuple of (pathlib.Path, int)
+        Resolved file path and its size in bytes (0 if it cannot be
+        stat-ed).
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs: List[Path] = []
+    for entry in entries:
+        name = entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if name not in _SKIP_DIRS and not name.startswith("."):
+                    subdirs.append(directory / name)
+                continue
+        except OSError:
+            continue
+        if not name.endswith(".py"):
+            continue
+
+        # Only symlinks can differ from their resolved path, since the walk
+        # starts from a resolved directory and never follows directory links.
+        if entry.is_symlink():
+            path = Path(entry.path).resolve()
+        else:
+            path = directory / name
+        try:
+            size = entry.stat().st_size
+        except OSError:
+            size = 0
+        yield path, size
+
+    for subdir in subdirs:
+        yield from _scan_python_files(subdir)
+
 
 class LSPEngine:
     """Engine for indexing Python projects and serving code intelligence queries.
@@ -30,6 +456,23 @@ class LSPEngine:
     max_eager_bytes : int, optional
         Maximum total byte size to eagerly index at initialization. Default
         is 5,000,000 (approximately 5 MB).
+    parallel : bool, optional
+        Parse the eagerly indexed files in worker processes when more than
+        one CPU is available. Workers are started with the ``"spawn"``
+        method, so scripts constructing the engine need the usual
+        ``if __name__ == "__main__"`` guard. Default is ``True``.
+    cache_dir : str or pathlib.Path or None, optional
+        Directory of the on-disk parse cache, which lets later runs skip
+        parsing unchanged files, e.g. ``DEFAULT_CACHE_DIR``. The least
+        recently used entries beyond ``_PARSE_CACHE_MAX_ENTRIES`` are
+        removed at startup. Default is ``None``, which disables the cache.
+    background : bool, optional
+        Keep indexing the remaining files on a daemon thread after the
+        initial index, smallest first. Symbol queries then wait for the
+        worker instead of parsing files themselves. Default is ``True``.
+    clean_docstrings : bool, optional
+        Clean up the indentation of returned docstrings, like
+        :func:`inspect.cleandoc`. Default is ``True``.
 
     Attributes
     ----------
@@ -49,10 +492,25 @@ class LSPEngine:
         project_root: Union[str, Path],
         max_eager_files: int = 200,
         max_eager_bytes: int = 5_000_000,
+        parallel: bool = True,
+        cache_dir: Optional[Union[str, Path]] = None,
+        background: bool = True,
+        clean_docstrings: bool = True,
     ) -> None:
         self.project_root = Path(project_root).resolve()
         self.max_eager_files = max_eager_files
         self.max_eager_bytes = max_eager_bytes
+        self.parallel = parallel
+        self.clean_docstrings = clean_docstrings
+        self.cache_dir: Optional[Path] = None
+        if cache_dir is not None:
+            try:
+                Path(cache_dir).mkdir(parents=True, exist_ok=True)
+                self.cache_dir = Path(cache_dir).resolve()
+                _prune_parse_cache(self.cache_dir, _PARSE_CACHE_MAX_ENTRIES)
+            except OSError:
+                # An unusable cache directory only costs re-parsing.
+                pass
 
         # File-level outline trees.
         self.outline_index: Dict[Path, OutlineNode] = {}
@@ -60,26 +518,74 @@ class LSPEngine:
         # Symbol definitions.
         # Qualified name -> definition.
         self.symbol_index: Dict[str, SymbolDefinition] = {}
-        # Simple name -> list of qualified names (for convenience lookups).
-        self._symbols_by_simple_name: Dict[str, List[str]] = {}
+        # Simple name -> qualified names (for convenience lookups). Most
+        # names are defined once, so a single qualified name is stored as is
+        # and only repeated names get a list.
+        self._symbols_by_simple_name: Dict[str, Union[str, List[str]]] = {}
 
         # Symbol references.
         # Full list as requested.
         self.references: List[SymbolReference] = []
         # By symbol name (simple).
         self._refs_by_symbol: Dict[str, List[SymbolReference]] = {}
+        # By file, in the order they were collected.
+        self._refs_by_file: Dict[Path, List[SymbolReference]] = {}
+
+        # Shared copies of docstrings, so equal texts from different symbols
+        # are stored once.
+        self._text_pool: Dict[str, str] = {}
 
         # Outline nodes indexed by qualified name for outline/tree lookups.
         self._node_index: Dict[str, OutlineNode] = {}
 
+        # Symbols in index order with their lowercase names joined into one
+        # buffer for substring search, rebuilt after the index changes.
+        self._name_table: Optional[Tuple[List[SymbolDefinition], str, List[int]]] = None
+
+        # Memoized get_definition_short/full results in least recently used
+        # order, cleared whenever the index changes. Each result is stored
+        # with the definition whose source it includes, if any.
+        self._definition_cache: OrderedDict[
+            Tuple[Any, ...], Tuple[Any, Optional[SymbolDefinition]]
+        ] = OrderedDict()
+        # Bumped whenever the index changes, so that results computed against
+        # an older index are not memoized.
+        self._index_generation = 0
+
         # File discovery & indexing state.
-        self._all_files: List[Path] = []
-        self._file_sizes: Dict[Path, int] = {}
+        # (size, path) of every discovered file, in discovery order.
+        self._files: List[Tuple[int, Path]] = []
+        self._discovered: set[Path] = set()
+        # Query path as given (made absolute) -> resolved path.
+        self._resolve_cache: Dict[str, Path] = {}
+        # Word of a file stem -> (size, path) of files whose stem contains
+        # it, used to find the files most likely to define a symbol.
+        self._stem_tokens: Dict[str, List[Tuple[int, Path]]] = {}
         self._total_bytes: int = 0
         self._indexed_files: set[Path] = set()
+        # Files the background worker could not parse. They are not retried
+        # until invalidated.
+        self._failed_files: set[Path] = set()
+
+        # Guards index mutation, since queries may run concurrently from a
+        # thread pool and lazily index files.
+        self._lock = threading.RLock()
+
+        # Background indexing state. The queue holds (priority, order, path)
+        # entries; symbol queries re-queue related files with priority -1.
+        self._bg_queue: queue.PriorityQueue[Tuple[int, int, Path]] = (
+            queue.PriorityQueue()
+        )
+        self._bg_thread: Optional[threading.Thread] = None
+        self._bg_done = False
+        # Symbol name -> event set once the symbol is defined or the
+        # background worker has indexed every file.
+        self._pending_symbols: Dict[str, threading.Event] = {}
 
         self._discover_files()
         self._initial_index()
+        if background:
+            self._start_background_index()
 
     # ------------------------------------------------------------------
     # Internal indexing helpers
@@ -95,24 +601,50 @@ class LSPEngine:
         This function is intentionally lightweight so that it can be run
         even on large projects without significant overhead.
         """
-        total_bytes = 0
-        all_files: List[Path] = []
-        file_sizes: Dict[Path, int] = {}
+        for path, size in _scan_python_files(self.project_root):
+            self._add_file(path, size)
 
-        for path in self.project_root.rglob("*.py"):
-            try:
-                stat = path.stat()
-                size = int(stat.st_size)
-            except OSError:
-                size = 0
-            path = path.resolve()
-            all_files.append(path)
-            file_sizes[path] = size
-            total_bytes += size
+    def _add_file(self, path: Path, size: int) -> None:
+        """Record a discovered file and add it to the stem word index.
 
-        self._all_files = all_files
-        self._file_sizes = file_sizes
-        self._total_bytes = total_bytes
+        Parameters
+        ----------
+        path : pathlib.Path
+            Resolved path to the Python file.
+        size : int
+            Size of the file in bytes.
+        """
+        entry = (size, path)
+        self._files.append(entry)
+        self._discovered.add(path)
+        self._total_bytes += size
+        for token in set(_name_tokens(path.stem)):
+            self._stem_tokens.setdefault(token, []).append(entry)
+
+    def _symbol_candidate_files(self, symbol: str) -> List[Path]:
+        """Return unindexed files whose stem shares a word with a symbol.
+
+        Parameters
+        ----------
+        symbol : str
+            Simple or qualified symbol name.
+
+        Returns
+        -------
+        list of pathlib.Path
+            Matching files that are not indexed yet, smallest first. Files
+            that failed to parse in the background are left out.
+        """
+        candidates: set[Tuple[int, Path]] = set()
+        for token in _name_tokens(symbol):
+            candidates.update(self._stem_tokens.get(token, ()))
+        indexed = self._indexed_files
+        failed = self._failed_files
+        return [
+            path
+            for _, path in sorted(candidates)
+            if path not in indexed and path not in failed
+        ]
 
     def _initial_index(self) -> None:
         """Perform an initial sparse index of the project.
@@ -124,21 +656,100 @@ class LSPEngine:
         smallest files (by size) are indexed up to the configured limits.
         Additional files are indexed lazily when needed.
         """
-        if not self._all_files:
+        if not self._files:
             return
 
-        files_sorted = sorted(self._all_files, key=lambda p: self._file_sizes.get(p, 0))
-
+        # Sorted by size only, so equal sizes keep their discovery order.
+        size_of = itemgetter(0)
         if (
-            len(self._all_files) <= self.max_eager_files
+            len(self._files) <= self.max_eager_files
             and self._total_bytes <= self.max_eager_bytes
         ):
-            to_index = files_sorted
+            # Smallest first, since registration order decides which of
+            # several same-named symbols a simple name resolves to.
+            selected = sorted(self._files, key=size_of)
+        else:
+            # Only the smallest files are needed, so avoid sorting them all.
+            selected = heapq.nsmallest(self.max_eager_files, self._files, key=size_of)
+            total_bytes = 0
+            for count, (size, _) in enumerate(selected):
+                total_bytes += size
+                if total_bytes > self.max_eager_bytes:
+                    del selected[count:]
+                    break
+        to_index = [path for _, path in selected]
+
+        workers = min(os.cpu_count() or 1, len(to_index) // _PARALLEL_CHUNKSIZE)
+        if self.parallel and workers > 1:
+            self._index_files_parallel(to_index, workers)
         else:
-            to_index = files_sorted[: self.max_eager_files]
+            for file_path in to_index:
+                self._index_file(file_path)
 
-        for file_path in to_index:
-            self._index_file(file_path)
+    def _index_files_parallel(self, file_paths: List[Path], workers: int) -> None:
+        """Parse files in worker processes and register them in order.
+
+        Parameters
+        ----------
+        file_paths : list of pathlib.Path
+            Resolved paths of the files to index.
+        workers : int
+            Number of worker processes.
+
+        Notes
+        -----
+        Only parsing runs in the workers, through :func:`_parse_file` so
+        that the parse cache is used. Results are registered on the calling
+        thread in the order of `file_paths`, so the resulting indexes are
+        the same as with serial indexing.
+        """
+        parse = functools.partial(
+            _parse_file, project_root=self.project_root, cache_dir=self.cache_dir
+        )
+        for file_path, parsed in parse_python_files(
+            file_paths, workers=workers, parse=parse
+        ):
+            if parsed is not None:
+                self._register_file(file_path, *parsed)
+
+    def _start_background_index(self) -> None:
+        """Queue the files left out of the initial index and start the worker."""
+        for order, (size, path) in enumerate(self._files):
+            if path not in self._indexed_files:
+                self._bg_queue.put((size, order, path))
+        if self._bg_queue.empty():
+            self._bg_done = True
+            return
+        self._bg_thread = threading.Thread(
+            target=self._background_index, name="lsp-engine-index", daemon=True
+        )
+        self._bg_thread.start()
+
+    def _background_index(self) -> None:
+        """Index queued files until the queue is empty.
+
+        Files that fail to parse are skipped and recorded in
+        ``_failed_files``. Once the queue is drained, all
+        pending symbol waiters are released.
+        """
+        while True:
+            try:
+                _, _, path = self._bg_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self._index_file(path)
+            except Exception:
+                # A broken file must not stop indexing of the others.
+                with self._lock:
+                    self._failed_files.add(path)
+                continue
+
+        with self._lock:
+            self._bg_done = True
+            for event in self._pending_symbols.values():
+                event.set()
+            self._pending_symbols.clear()
 
     def _index_file(self, file_path: Path) -> None:
         """Index a single file if it has not been indexed yet.
@@ -146,37 +757,62 @@ class LSPEngine:
         Parameters
         ----------
         file_path : pathlib.Path
-            Path to the Python file.
+            Resolved path to the Python file. Paths are only resolved at the
+            public API entry points, so that discovered files do not go
+            through the query path cache.
 
         Notes
         -----
         This function parses the file, builds its outline tree, collects
         symbol definitions and references, and updates internal indexes.
         """
-        file_path = file_path.resolve()
         if file_path in self._indexed_files:
             return
 
-        if not file_path.exists():
-            return
+        parsed = _parse_file(file_path, self.project_root, self.cache_dir)
+        if parsed is not None:
+            self._register_file(file_path, *parsed)
 
-        module_node, definitions, references = parse_python_file(
-            file_path=file_path, project_root=self.project_root
-        )
+    def _register_file(
+        self,
+        file_path: Path,
+        module_node: OutlineNode,
+        definitions: Dict[str, List[SymbolDefinition]],
+        references: List[SymbolReference],
+    ) -> None:
+        """Register the parse results of a file in the indexes.
 
-        self.outline_index[file_path] = module_node
-        self._indexed_files.add(file_path)
+        Parameters
+        ----------
+        file_path : pathlib.Path
+            Resolved path to the Python file.
+        module_node : OutlineNode
+            Root outline node of the module.
+        definitions : dict of str to list of SymbolDefinition
+            Definitions found in the file. Of several definitions of one
+            qualified name, the first is registered.
+        references : list of SymbolReference
+            References found in the file.
+        """
+        with self._lock:
+            # Another thread may have indexed the file while we were parsing.
+            if file_path in self._indexed_files:
+                return
 
-        # Register outline nodes (module_node and its children).
-        self._register_outline_node(module_node)
+            self.outline_index[file_path] = module_node
+            self._indexed_files.add(file_path)
+            self._definition_cache.clear()
+            self._index_generation += 1
 
-        # Register definitions.
-        for defn in definitions.values():
-            self._register_definition(defn)
+            # Register outline nodes (module_node and its children).
+            self._register_outline_node(module_node)
 
-        # Register references.
-        for ref in references:
-            self._register_reference(ref)
+            # Register definitions.
+            for defs in definitions.values():
+                self._register_definition(defs[0])
+
+            # Register references.
+            self._register_references(file_path, references)
 
     def _register_outline_node(self, node: OutlineNode) -> None:
         """Register an outline node and its children in the node index.
@@ -186,10 +822,19 @@ class LSPEngine:
         node : OutlineNode
             Node to be registered.
         """
-        qualname = node.symbol.qualified_name
-        self._node_index[qualname] = node
-        for child in node.children:
-            self._register_outline_node(child)
+        # Iterative pre-order walk; children are pushed in reverse so that
+        # nodes are visited in source order. Within a file, the first node
+        # of a qualified name wins, matching the registered definition.
+        node_index = self._node_index
+        seen: set[str] = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            qualname = current.symbol.qualified_name
+            if qualname not in seen:
+                seen.add(qualname)
+                node_index[qualname] = current
+            stack.extend(reversed(current.children))
 
     def _register_definition(self, defn: SymbolDefinition) -> None:
         """Register a symbol definition in the symbol indexes.
@@ -199,47 +844,211 @@ class LSPEngine:
         defn : SymbolDefinition
             The symbol definition to register.
         """
+        # Names, kinds and annotations repeat across many symbols; intern
+        # them and share equal docstrings.
+        defn.name = sys.intern(defn.name)
+        defn.kind = sys.intern(defn.kind)
+        if defn.type_annotation:
+            defn.type_annotation = sys.intern(defn.type_annotation)
+        # Lowercase search fields, computed once rather than per query.
+        # Names are usually lowercase already, in which case the name itself
+        # is shared.
+        name_lower = defn.name.lower()
+        defn._name_lower = defn.name if name_lower == defn.name else name_lower
+        defn._kind_lower = sys.intern(defn.kind.lower())
+        defn._type_lower = sys.intern((defn.type_annotation or "").lower())
+        pool = self._text_pool
+        if defn.docstring:
+            defn.docstring = pool.setdefault(defn.docstring, defn.docstring)
+        if defn.init_docstring:
+            defn.init_docstring = pool.setdefault(
+                defn.init_docstring, defn.init_docstring
+            )
+
         self.symbol_index[defn.qualified_name] = defn
-        self._symbols_by_simple_name.setdefault(defn.name, []).append(
-            defn.qualified_name
-        )
+        self._name_table = None
+        by_name = self._symbols_by_simple_name
+        qualnames = by_name.get(defn.name)
+        if qualnames is None:
+            by_name[defn.name] = defn.qualified_name
+        elif isinstance(qualnames, str):
+            by_name[defn.name] = [qualnames, defn.qualified_name]
+        else:
+            qualnames.append(defn.qualified_name)
+        if self._pending_symbols:
+            for key in (defn.name, defn.qualified_name):
+                event = self._pending_symbols.pop(key, None)
+                if event is not None:
+                    event.set()
+
+    def _register_references(
+        self, file_path: Path, references: List[SymbolReference]
+    ) -> None:
+        """Register the symbol references of a file in the reference indexes.
 
-    def _register_reference(self, ref: SymbolReference) -> None:
-        """Register a symbol reference in the reference indexes.
+        References are grouped by symbol first, so each symbol's bucket in
+        the index is looked up once per file rather than once per reference.
 
         Parameters
         ----------
-        ref : SymbolReference
-            The symbol reference to register.
+        file_path : pathlib.Path
+            Resolved path to the file the references were found in.
+        references : list of SymbolReference
+            The symbol references to register.
         """
-        self.references.append(ref)
-        self._refs_by_symbol.setdefault(ref.symbol, []).append(ref)
+        intern = sys.intern
+        buckets: Dict[str, List[SymbolReference]] = {}
+        for ref in references:
+            ref.symbol = intern(ref.symbol)
+            group = buckets.get(ref.symbol)
+            if group is None:
+                buckets[ref.symbol] = [ref]
+            else:
+                group.append(ref)
+
+        refs_by_symbol = self._refs_by_symbol
+        for name, group in buckets.items():
+            bucket = refs_by_symbol.get(name)
+            if bucket is None:
+                refs_by_symbol[name] = group
+            else:
+                bucket.extend(group)
+        self.references.extend(references)
+        self._refs_by_file.setdefault(file_path, []).extend(references)
+
+    def _resolve(self, file_path: Union[str, Path]) -> Path:
+        """Resolve a path, caching the result.
+
+        ``Path.resolve`` inspects every component of the path, so results
+        are cached by the absolute form of the path as given.
 
-    def _ensure_file_indexed(self, file_path: Union[str, Path]) -> None:
+        Parameters
+        ----------
+        file_path : str or pathlib.Path
+            Path to resolve.
+
+        Returns
+        -------
+        pathlib.Path
+            Resolved absolute path.
+        """
+        key = os.fspath(file_path)
+        if not os.path.isabs(key):
+            key = os.path.join(os.getcwd(), key)
+        path = self._resolve_cache.get(key)
+        if path is None:
+            path = Path(key).resolve()
+            if len(self._resolve_cache) >= _RESOLVE_CACHE_MAX_ENTRIES:
+                self._resolve_cache.clear()
+            self._resolve_cache[key] = path
+        return path
+
+    def _ensure_file_indexed(self, file_path: Union[str, Path]) -> Path:
         """Ensure that a given file has been indexed, indexing it if needed.
 
         Parameters
         ----------
         file_path : str or pathlib.Path
             Path to the Python file.
+
+        Returns
+        -------
+        pathlib.Path
+            Resolved path of the file.
         """
-        path = Path(file_path).resolve()
+        path = self._resolve(file_path)
         if path not in self._indexed_files:
             # If this file was not discovered initially, add it now.
-            if path not in self._all_files:
-                self._all_files.append(path)
+            if path not in self._discovered:
                 try:
-                    self._file_sizes[path] = int(path.stat().st_size)
+                    size = path.stat().st_size
                 except OSError:
-                    self._file_sizes[path] = 0
+                    size = 0
+                self._add_file(path, size)
             self._index_file(path)
+            if path not in self._indexed_files:
+                # Missing or unreadable; resolve again next time in case the
+                # path is created, e.g. behind a symlink.
+                self._resolve_cache.clear()
+        return path
+
+    def invalidate(self, file_path: Union[str, Path]) -> None:
+        """Forget everything indexed from a file, e.g. after it changed.
+
+        The file's parse cache entry and its definitions, outline nodes and
+        references are dropped. It is parsed again the next time a query
+        needs it.
+
+        Parameters
+        ----------
+        file_path : str or pathlib.Path
+            Path to the Python file.
+        """
+        self._forget_file(self._resolve(file_path))
+
+    def _forget_file(self, path: Path) -> None:
+        """Drop a file's parse cache entry and everything indexed from it.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Resolved path to the Python file.
+        """
+        if self.cache_dir is not None:
+            try:
+                os.unlink(_parse_cache_path(self.cache_dir, path, self.project_root))
+            except OSError:
+                pass
+
+        with self._lock:
+            self._indexed_files.discard(path)
+            self._failed_files.discard(path)
+            module_node = self.outline_index.pop(path, None)
+            if module_node is None:
+                return
+
+            self._name_table = None
+            self._definition_cache.clear()
+            self._index_generation += 1
+            removed: set[str] = set()
+            stack = [module_node]
+            while stack:
+                node = stack.pop()
+                defn = node.symbol
+                qualname = defn.qualified_name
+                removed.add(qualname)
+                if self._node_index.get(qualname) is node:
+                    del self._node_index[qualname]
+                if self.symbol_index.get(qualname) is defn:
+                    del self.symbol_index[qualname]
+                qualnames = self._symbols_by_simple_name.get(defn.name)
+                if isinstance(qualnames, str):
+                    if qualnames in removed:
+                        del self._symbols_by_simple_name[defn.name]
+                elif qualnames is not None:
+                    qualnames[:] = [q for q in qualnames if q not in removed]
+                    if not qualnames:
+                        del self._symbols_by_simple_name[defn.name]
+                stack.extend(node.children)
+
+            file_refs = self._refs_by_file.pop(path, None)
+            if file_refs:
+                self.references = [r for r in self.references if r.file_path != path]
+                for name in {ref.symbol for ref in file_refs}:
+                    refs = [
+                        r for r in self._refs_by_symbol[name] if r.file_path != path
+                    ]
+                    if refs:
+                        self._refs_by_symbol[name] = refs
+                    else:
+                        del self._refs_by_symbol[name]
 
     def _ensure_symbol_indexed(self, symbol: str) -> None:
         """Ensure that a given symbol has been indexed.
 
         This method attempts to find a definition for the symbol by
         progressively indexing additional files, prioritizing files whose
-        names look related to the symbol.
+        stems share a word with the symbol.
 
         Parameters
         ----------
@@ -249,22 +1058,93 @@ class LSPEngine:
         if symbol in self.symbol_index or symbol in self._symbols_by_simple_name:
             return
 
-        remaining = [p for p in self._all_files if p not in self._indexed_files]
-        if not remaining:
+        finished = True
+        if self._bg_thread is not None:
+            finished = self._wait_for_symbol(symbol)
+            if symbol in self.symbol_index or symbol in self._symbols_by_simple_name:
+                return
+            # Once the worker is done, files invalidated since then are
+            # indexed here, like without background indexing. Files it
+            # failed to parse are not retried.
+
+        # Files whose stem shares a word with the symbol go first, then the
+        # rest of the project by size.
+        for path in self._symbol_candidate_files(symbol):
+            self._index_file(path)
+            if symbol in self.symbol_index or symbol in self._symbols_by_simple_name:
+                return
+        if not finished:
+            # The worker is still indexing the rest of the project.
             return
 
-        # Prioritize files whose stem contains the symbol, then by size.
-        def score(path: Path) -> Tuple[int, int]:
-            stem = path.stem.lower()
-            match = 0 if symbol.lower() in stem else 1
-            size = self._file_sizes.get(path, 0)
-            return (match, size)
-
-        for path in sorted(remaining, key=score):
+        remaining = [
+            f
+            for f in self._files
+            if f[1] not in self._indexed_files and f[1] not in self._failed_files
+        ]
+        remaining.sort(key=itemgetter(0))
+        for _, path in remaining:
             self._index_file(path)
             if symbol in self.symbol_index or symbol in self._symbols_by_simple_name:
                 break
 
+    def _wait_for_symbol(self, symbol: str) -> bool:
+        """Wait until the background worker has indexed a symbol.
+
+        Files whose stem shares a word with the symbol are moved to the
+        front of the background queue. The wait ends when the symbol is
+        defined, when every file has been indexed, or after
+        ``_SYMBOL_WAIT_TIMEOUT`` seconds.
+
+        Parameters
+        ----------
+        symbol : str
+            Simple or qualified symbol name.
+
+        Returns
+        -------
+        bool
+            ``False`` if the wait timed out, ``True`` otherwise. A worker
+            that died counts as done.
+        """
+        with self._lock:
+            if (
+                self._bg_done
+                or symbol in self.symbol_index
+                or symbol in self._symbols_by_simple_name
+            ):
+                return True
+            event = self._pending_symbols.get(symbol)
+            if event is None:
+                event = self._pending_symbols[symbol] = threading.Event()
+                for order, path in enumerate(self._symbol_candidate_files(symbol)):
+                    self._bg_queue.put((-1, order, path))
+        if event.wait(_SYMBOL_WAIT_TIMEOUT):
+            return True
+        thread = self._bg_thread
+        return thread is None or not thread.is_alive()
+
+    def _symbol_name_table(self) -> Tuple[List[SymbolDefinition], str, List[int]]:
+        """Return the indexed symbols with a joined buffer of their names.
+
+        Returns
+        -------
+        tuple of (list of SymbolDefinition, str, list of int)
+            Definitions in index order, their lowercase names joined and
+            terminated by ``"\\0"``, and the offset of each name followed by
+            the buffer length.
+        """
+        with self._lock:
+            if self._name_table is None:
+                defs = list(self.symbol_index.values())
+                names = [d._name_lower for d in defs]
+                buffer = "\0".join(names) + "\0"
+                starts = list(
+                    itertools.accumulate((len(n) + 1 for n in names), initial=0)
+                )
+                self._name_table = (defs, buffer, starts)
+            return self._name_table
+
     def _resolve_symbol_qualified_name(self, symbol: str) -> Optional[str]:
         """Resolve a symbol name to a qualified name if possible.
 
@@ -280,14 +1160,146 @@ class LSPEngine:
         """
         if symbol in self.symbol_index:
             return symbol
-        if symbol in self._symbols_by_simple_name:
+        qualnames = self._symbols_by_simple_name.get(symbol)
+        if qualnames is not None:
+            if isinstance(qualnames, str):
+                return qualnames
             # Choose the first occurrence; you may want to refine this.
-            return self._symbols_by_simple_name[symbol][0]
+            return qualnames[0]
         return None
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
+    def _lookup_definition(
+        self,
+        symbol: Optional[str],
+        file_path: Optional[Union[str, Path]],
+    ) -> Optional[SymbolDefinition]:
+        """Find the definition of a symbol, or of a module by file path.
+
+        Parameters
+        ----------
+        symbol : str or None
+            Symbol name or qualified name. Takes precedence over `file_path`.
+        file_path : str or pathlib.Path or None
+            Path to a Python file whose module definition to return.
+
+        Returns
+        -------
+        SymbolDefinition or None
+            The definition, or ``None`` if it cannot be found.
+        """
+        if symbol is not None:
+            self._ensure_symbol_indexed(symbol)
+            qualname = self._resolve_symbol_qualified_name(symbol)
+            if qualname is None:
+                return None
+            return self.symbol_index.get(qualname)
+        if file_path is not None:
+            path = self._ensure_file_indexed(file_path)
+            module_node = self.outline_index.get(path)
+            return module_node.symbol if module_node is not None else None
+        return None
+
+    def _definition_cache_key(
+        self,
+        query: str,
+        symbol: Optional[str],
+        file_path: Optional[Union[str, Path]],
+        max_chars: int,
+    ) -> Tuple[Any, ...]:
+        """Build the memoization key of a definition query.
+
+        Parameters
+        ----------
+        query : str
+            Name of the query, ``"short"`` or ``"full"``.
+        symbol : str or None
+            Queried symbol.
+        file_path : str or pathlib.Path or None
+            Queried file path, ignored if `symbol` is given.
+        max_chars : int
+            Clamped maximum text length.
+
+        Returns
+        -------
+        tuple
+            Hashable key.
+        """
+        if symbol is not None or file_path is None:
+            return (query, symbol, None, max_chars)
+        return (query, None, self._resolve(file_path), max_chars)
+
+    def _cached_definition(self, key: Tuple[Any, ...]) -> Tuple[Any, int]:
+        """Return a memoized definition query result.
+
+        Parameters
+        ----------
+        key : tuple
+            Key from :meth:`_definition_cache_key`.
+
+        Returns
+        -------
+        result : dict or None or object
+            A copy of the cached result, or ``_MISSING`` if there is none or
+            if it includes the source of a file that changed since.
+        generation : int
+            Index generation at the time of the lookup, to pass to
+            :meth:`_store_definition` along with a freshly computed result.
+        """
+        with self._lock:
+            generation = self._index_generation
+            entry = self._definition_cache.get(key)
+            if entry is None:
+                return _MISSING, generation
+            self._definition_cache.move_to_end(key)
+        result, source_defn = entry
+        if source_defn is not None and not _is_current(source_defn):
+            return _MISSING, generation
+        return (dict(result) if result is not None else None), generation
+
+    def _store_definition(
+        self,
+        key: Tuple[Any, ...],
+        generation: int,
+        result: Optional[Dict[str, Any]],
+        source_defn: Optional[SymbolDefinition] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Memoize a definition query result.
+
+        The result is not memoized if the index changed since `generation`,
+        since it may then be stale, e.g. a ``None`` for a symbol whose file
+        was registered meanwhile.
+
+        Parameters
+        ----------
+        key : tuple
+            Key from :meth:`_definition_cache_key`.
+        generation : int
+            Index generation returned by :meth:`_cached_definition` before
+            the result was computed.
+        result : dict or None
+            Result of the query.
+        source_defn : SymbolDefinition or None, optional
+            Definition whose source `result` includes. The result is only
+            served from the cache while the definition's file is unchanged.
+
+        Returns
+        -------
+        dict or None
+            `result`, unchanged. The cache keeps its own copy, so callers
+            may modify it.
+        """
+        with self._lock:
+            if generation != self._index_generation:
+                return result
+            cache = self._definition_cache
+            cache[key] = (dict(result) if result is not None else None, source_defn)
+            if len(cache) > _DEFINITION_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+        return result
+
     def get_definition_short(
         self,
         symbol: Optional[str] = None,
@@ -315,42 +1327,32 @@ class LSPEngine:
             ``None`` if the symbol cannot be found.
         """
         max_chars = min(MAX_CHARS_HARD_LIMIT, max_chars)
-        if symbol is not None:
-            self._ensure_symbol_indexed(symbol)
-            qualname = self._resolve_symbol_qualified_name(symbol)
-            if qualname is None:
-                return None
-            defn = self.symbol_index.get(qualname)
-        elif file_path is not None:
-            self._ensure_file_indexed(file_path)
-            path = Path(file_path).resolve()
-            module_node = self.outline_index.get(path)
-            defn = module_node.symbol if module_node is not None else None
-        else:
-            return None
+        key = self._definition_cache_key("short", symbol, file_path, max_chars)
+        cached, generation = self._cached_definition(key)
+        if cached is not _MISSING:
+            return cached
 
+        defn = self._lookup_definition(symbol, file_path)
         if defn is None:
-            return None
-
-        doc = defn.docstring
-        if doc and len(doc) > max_chars:
-            doc = doc[:max_chars] + "…"
-
-        init_doc = defn.init_docstring
-        if init_doc and len(init_doc) > max_chars:
-            init_doc = init_doc[:max_chars] + "…"
-
-        return {
-            "name": defn.name,
-            # "qualified_name": defn.qualified_name,
-            "kind": defn.kind,
-            "type": defn.type_annotation,
-            "file_path": str(defn.file_path),
-            # "line": defn.line,
-            # "column": defn.column,
-            "docstring": doc,
-            "init_docstring": init_doc,
-        }
+            return self._store_definition(key, generation, None)
+
+        return self._store_definition(
+            key,
+            generation,
+            {
+                "name": defn.name,
+                # "qualified_name": defn.qualified_name,
+                "kind": defn.kind,
+                "type": defn.type_annotation,
+                "file_path": str(defn.file_path),
+                # "line": defn.line,
+                # "column": defn.column,
+                "docstring": _truncate(self._docstring(defn.docstring), max_chars),
+                "init_docstring": _truncate(
+                    self._docstring(defn.init_docstring), max_chars
+                ),
+            },
+        )
 
     def get_definition_full(
         self,
@@ -379,39 +1381,56 @@ class LSPEngine:
             or ``None`` if the symbol cannot be found.
         """
         max_chars = min(MAX_CHARS_HARD_LIMIT, max_chars)
-        if symbol is not None:
-            self._ensure_symbol_indexed(symbol)
-            qualname = self._resolve_symbol_qualified_name(symbol)
-            if qualname is None:
-                return None
-            defn = self.symbol_index.get(qualname)
-        elif file_path is not None:
-            self._ensure_file_indexed(file_path)
-            path = Path(file_path).resolve()
-            module_node = self.outline_index.get(path)
-            defn = module_node.symbol if module_node is not None else None
-        else:
-            return None
-
+        key = self._definition_cache_key("full", symbol, file_path, max_chars)
+        cached, generation = self._cached_definition(key)
+        if cached is not _MISSING:
+            return cached
+
+        defn = self._lookup_definition(symbol, file_path)
+        if defn is not None and not _is_current(defn):
+            # The file changed since it was indexed, so the recorded span no
+            # longer matches its contents; index it again.
+            self._forget_file(defn.file_path)
+            defn = self._lookup_definition(symbol, file_path)
         if defn is None:
-            return None
-
-        source = defn.full_source or ""
-        if len(source) > max_chars:
-            source = source[:max_chars] + "\n…(truncated)"
-
-        return {
-            "name": defn.name,
-            # "qualified_name": defn.qualified_name,
-            "kind": defn.kind,
-            "type": defn.type_annotation,
-            "file_path": str(defn.file_path),
-            "line": defn.line,
-            "column": defn.column,
-            "docstring": defn.docstring,
-            "init_docstring": defn.init_docstring,
-            "source": source,
-        }
+            return self._store_definition(key, generation, None)
+
+        source = _truncate(defn.full_source or "", max_chars, "\n…(truncated)")
+
+        return self._store_definition(
+            key,
+            generation,
+            {
+                "name": defn.name,
+                # "qualified_name": defn.qualified_name,
+                "kind": defn.kind,
+                "type": defn.type_annotation,
+                "file_path": str(defn.file_path),
+                "line": defn.line,
+                "column": defn.column,
+                "docstring": self._docstring(defn.docstring),
+                "init_docstring": self._docstring(defn.init_docstring),
+                "source": source,
+            },
+            defn,
+        )
+
+    def _docstring(self, text: Optional[str]) -> Optional[str]:
+        """Prepare a stored docstring for output.
+
+        Parameters
+        ----------
+        text : str or None
+            Docstring as stored in the index.
+
+        Returns
+        -------
+        str or None
+            `text`, cleaned up if ``clean_docstrings`` is set.
+        """
+        if text and self.clean_docstrings:
+            return _clean_docstring(text)
+        return text
 
     def _serialize_outline_node(
         self,
@@ -425,38 +1444,44 @@ class LSPEngine:
         node : OutlineNode
             Node to serialize.
         max_chars : int
-            Maximum length for docstring fields.
+            Maximum length for docstring fields, already clamped to
+            ``MAX_CHARS_HARD_LIMIT``.
 
         Returns
         -------
         dict
             Serialized representation of the node and its children.
         """
-        max_chars = min(MAX_CHARS_HARD_LIMIT, max_chars)
-        defn = node.symbol
-        doc = defn.docstring
-        if doc and len(doc) > max_chars:
-            doc = doc[:max_chars] + "…"
-
-        init_doc = defn.init_docstring
-        if init_doc and len(init_doc) > max_chars:
-            init_doc = init_doc[:max_chars] + "…"
-
-        return {
-            "name": defn.name,
-            # "qualified_name": defn.qualified_name,
-            "kind": defn.kind,
-            "type": defn.type_annotation,
-            "file_path": str(defn.file_path),
-            "line": defn.line,
-            "column": defn.column,
-            "docstring": doc,
-            "init_docstring": init_doc,
-            "children": [
-                self._serialize_outline_node(child, max_chars)
-                for child in node.children
-            ],
-        }
+        # A subtree never spans files, so the path is converted once.
+        file_path = str(node.symbol.file_path)
+        root: Dict[str, Any] = {}
+        # (node, list to append its dict to); the root dict is returned.
+        stack: List[Tuple[OutlineNode, Optional[List[Dict[str, Any]]]]] = [(node, None)]
+        while stack:
+            current, siblings = stack.pop()
+            defn = current.symbol
+            children: List[Dict[str, Any]] = []
+            serialized = {
+                "name": defn.name,
+                # "qualified_name": defn.qualified_name,
+                "kind": defn.kind,
+                "type": defn.type_annotation,
+                "file_path": file_path,
+                "line": defn.line,
+                "column": defn.column,
+                "docstring": _truncate(self._docstring(defn.docstring), max_chars),
+                "init_docstring": _truncate(
+                    self._docstring(defn.init_docstring), max_chars
+                ),
+                "children": children,
+            }
+            if siblings is None:
+                root = serialized
+            else:
+                siblings.append(serialized)
+            # Reversed so that children are popped, and appended, in order.
+            stack.extend((child, children) for child in reversed(current.children))
+        return root
 
     def get_outline(
         self,
@@ -496,8 +1521,7 @@ class LSPEngine:
             if node is None:
                 return []
         elif file_path is not None:
-            self._ensure_file_indexed(file_path)
-            path = Path(file_path).resolve()
+            path = self._ensure_file_indexed(file_path)
             node = self.outline_index.get(path)
             if node is None:
                 return []
@@ -510,6 +1534,37 @@ class LSPEngine:
             self._serialize_outline_node(child, max_chars) for child in node.children
         ]
 
+    def get_outline_json(
+        self,
+        symbol: Optional[str] = None,
+        file_path: Optional[Union[str, Path]] = None,
+        max_chars: int = 1000,
+    ) -> bytes:
+        """Return an outline tree for a symbol or module as JSON.
+
+        This is :meth:`get_outline` serialized in one step, for callers that
+        send the outline on as JSON rather than using the Python objects.
+
+        Parameters
+        ----------
+        symbol : str, optional
+            Symbol name or qualified name. If provided, the outline is
+            generated from that symbol node downward.
+        file_path : str or pathlib.Path, optional
+            File path. If provided and `symbol` is ``None``, the outline
+            for the module corresponding to that file is returned.
+        max_chars : int, optional
+            Maximum length for docstring fields. Default is 1000.
+
+        Returns
+        -------
+        bytes
+            UTF-8 encoded JSON array of the serialized child nodes.
+        """
+        return _dumps_json(
+            self.get_outline(symbol=symbol, file_path=file_path, max_chars=max_chars)
+        )
+
     def get_references(
         self,
         symbol: Optional[str] = None,
@@ -549,24 +1604,21 @@ class LSPEngine:
             self._ensure_symbol_indexed(symbol)
             results = self._refs_by_symbol.get(symbol, [])
         elif file_path is not None:
-            self._ensure_file_indexed(file_path)
-            path = Path(file_path).resolve()
-            results = [ref for ref in self.references if ref.file_path == path]
+            path = self._ensure_file_indexed(file_path)
+            with self._lock:
+                results = list(self._refs_by_file.get(path, ()))
         else:
             return []
 
         out: List[Dict[str, Any]] = []
         for ref in results:
-            ctx = ref.context
-            if ctx and len(ctx) > max_chars:
-                ctx = ctx[:max_chars] + "…"
             out.append(
                 {
                     "symbol": ref.symbol,
                     "file_path": str(ref.file_path),
                     "line": ref.line,
                     "column": ref.column,
-                    # "context": ctx,
+                    # "context": _truncate(ref.context, max_chars),
                 }
             )
         return out
@@ -606,31 +1658,39 @@ class LSPEngine:
         matches: List[Dict[str, Any]] = []
 
         # Ensure file is indexed if filtering by file
+        candidates: Iterable[SymbolDefinition]
         if file_path is not None:
-            self._ensure_file_indexed(file_path)
-            path = Path(file_path).resolve()
-            candidates = [d for d in self.symbol_index.values() if d.file_path == path]
+            path = self._ensure_file_indexed(file_path)
+            with self._lock:
+                candidates = [
+                    d for d in self.symbol_index.values() if d.file_path == path
+                ]
+        elif name:
+            # Find name matches with str.find over one joined buffer rather
+            # than a Python-level test per symbol.
+            defs, buffer, starts = self._symbol_name_table()
+            candidates = (
+                defs[row] for row in _substring_rows(buffer, starts, name.lower())
+            )
+            name = None
         else:
-            candidates = list(self.symbol_index.values())
+            with self._lock:
+                candidates = list(self.symbol_index.values())
 
-        # Apply filters
+        # Lowercase the needles once rather than per candidate.
+        name_l = name.lower() if name else None
+        kind_l = kind.lower() if kind else None
+        type_l = type_hint.lower() if type_hint else None
+
+        # Apply filters, cheapest first: kind is a short equality test, the
+        # others are substring scans.
         for defn in candidates:
-            if name and name.lower() not in defn.name.lower():
+            if kind_l and defn._kind_lower != kind_l:
                 continue
-            if kind and defn.kind.lower() != kind.lower():
+            if type_l and type_l not in defn._type_lower:
+                continue
+            if name_l and name_l not in defn._name_lower:
                 continue
-            if type_hint:
-                ann = defn.type_annotation or ""
-                if type_hint.lower() not in ann.lower():
-                    continue
-
-            doc = defn.docstring or ""
-            if len(doc) > max_chars:
-                doc = doc[:max_chars] + "…"
-
-            init_doc = defn.init_docstring or ""
-            if len(init_doc) > max_chars:
-                init_doc = init_doc[:max_chars] + "…"
 
             matches.append(
                 {
@@ -641,8 +1701,8 @@ class LSPEngine:
                     "file_path": str(defn.file_path),
                     # "line": defn.line,
                     # "column": defn.column,
-                    # "docstring": doc,
-                    # "init_docstring": init_doc,
+                    # "docstring": _truncate(defn.docstring, max_chars),
+                    # "init_docstring": _truncate(defn.init_docstring, max_chars),
                 }
             )
 
@@ -2,12 +2,20 @@
 from __future__ import annotations
 
 import ast
+import codecs
+import functools
+import itertools
+import keyword
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolDefinition:
     """Description of a symbol definition in the codebase.
 
@@ -32,16 +40,28 @@ class SymbolDefinition:
     column : int
         0-based column offset of the symbol definition.
     docstring : str or None
-        Docstring associated with the symbol, if any.
+        Docstring associated with the symbol, if any, as written in the
+        source; indentation is not cleaned up.
     init_docstring : str or None
         Docstring associated with the ``__init__`` method if the symbol is a
         class and such a method exists.
-    full_source : str or None
-        Source code corresponding to the full definition of the symbol,
-        including its body.
+    source_span : tuple of (int, int) or None
+        Start and end byte offsets of the full definition of the symbol,
+        including its body, in the file. The source itself is only read
+        when :attr:`full_source` is accessed.
+    source_stamp : tuple of (int, int)
+        Modification time in nanoseconds and size of the file when it was
+        parsed. `source_span` is only valid for that version of the file.
     qualified_name : str
         Fully qualified name of the symbol, including module and parents,
         e.g. ``"package.module.MyClass.method"``.
+
+    Notes
+    -----
+    The lowercase forms of `name`, `kind` and `type_annotation` (the latter
+    as ``""`` when missing) are kept in ``_name_lower``, ``_kind_lower`` and
+    ``_type_lower`` for case-insensitive searches. They are filled in when
+    the symbol is registered in an index.
     """
 
     parent_qualified_name: Optional[str]
@@ -53,11 +73,46 @@ class SymbolDefinition:
     column: int
     docstring: Optional[str]
     init_docstring: Optional[str]
-    full_source: Optional[str]
+    source_span: Optional[Tuple[int, int]]
+    source_stamp: Tuple[int, int]
     qualified_name: str
-
-
-@dataclass
+    _name_lower: str = field(default="", init=False, repr=False, compare=False)
+    _kind_lower: str = field(default="", init=False, repr=False, compare=False)
+    _type_lower: str = field(default="", init=False, repr=False, compare=False)
+
+    @property
+    def full_source(self) -> Optional[str]:
+        """Source code of the full definition, including its body.
+
+        The source is read from the file on each access rather than kept
+        in memory, with line endings normalised to ``"\\n"`` as when the
+        file was parsed.
+
+        Returns
+        -------
+        str or None
+            Source text, or ``None`` if the symbol has no span, the file
+            cannot be read, or it changed since it was parsed.
+        """
+        if self.source_span is None:
+            return None
+        start, end = self.source_span
+        try:
+            with open(self.file_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if (st.st_mtime_ns, st.st_size) != self.source_stamp:
+                    return None
+                f.seek(start)
+                raw = f.read(end - start)
+        except OSError:
+            return None
+        source = raw.decode("utf-8", "replace")
+        if "\r" in source:
+            source = source.replace("\r\n", "\n").replace("\r", "\n")
+        return source
+
+
+@dataclass(slots=True)
 class OutlineNode:
     """Node in the outline tree.
 
@@ -76,7 +131,7 @@ class OutlineNode:
     children: List["OutlineNode"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolReference:
     """Description of a symbol reference in the codebase.
 
@@ -103,6 +158,13 @@ class SymbolReference:
     context: Optional[str] = None
 
 
+# Files handed to a worker process at a time by parse_python_files.
+_CHUNKSIZE = 8
+
+# Definition and outline node of the scope a statement is defined in.
+_Scope = Optional[Tuple[SymbolDefinition, OutlineNode]]
+
+
 def _compute_module_qualified_name(
     file_path: Path,
     project_root: Optional[Path] = None,
@@ -135,7 +197,7 @@ def _compute_module_qualified_name(
 
 
 def _extract_context_window(
-    text: str,
+    lines: List[str],
     line: int,
     window: int = 1,
 ) -> str:
@@ -143,8 +205,9 @@ def _extract_context_window(
 
     Parameters
     ----------
-    text : str
-        Full source text of the file.
+    lines : list of str
+        Lines of the file, as returned by ``text.splitlines()``. They are
+        split once per file rather than once per reference.
     line : int
         1-based line number of the reference.
     window : int, optional
@@ -156,17 +219,74 @@ def _extract_context_window(
     str
         Context block as a single string with newline separators.
     """
-    lines = text.splitlines()
     idx = max(0, line - 1)
     start = max(0, idx - window)
     end = min(len(lines), idx + window + 1)
     return "\n".join(lines[start:end])
 
 
+def _byte_line_offsets(raw: bytes) -> List[int]:
+    """Compute the byte offset at which each line of a file starts.
+
+    Parameters
+    ----------
+    raw : bytes
+        Raw file contents.
+
+    Returns
+    -------
+    list of int
+        Offset of the start of each line, indexed by 0-based line number.
+        If the file does not end with a line break, the last entry is the
+        file size.
+    """
+    # bytes.splitlines breaks on "\r\n", "\r" and "\n" only, like the
+    # tokenizer.
+    return list(itertools.accumulate(map(len, raw.splitlines(True)), initial=0))
+
+
+# A line that can be skipped without parsing: blank, a comment, or a
+# single-line import statement. Imports define no symbols of their own and
+# contain no Name nodes, so files made only of such lines (typically
+# package ``__init__`` files) yield just their module symbol. Keywords are
+# not identifiers, so e.g. ``import class`` is left to ``ast.parse`` to
+# reject.
+_KEYWORD = rf"(?:{'|'.join(keyword.kwlist)})(?!\w)"
+_IDENT = rf"(?!{_KEYWORD})[A-Za-z_]\w*"
+_DOTTED = rf"{_IDENT}(?:\.{_IDENT})*"
+_DOTTED_ALIAS = rf"{_DOTTED}(?:[ \t]+as[ \t]+{_IDENT})?"
+_NAME_ALIAS = rf"{_IDENT}(?:[ \t]+as[ \t]+{_IDENT})?"
+_IMPORT = rf"import[ \t]+{_DOTTED_ALIAS}(?:[ \t]*,[ \t]*{_DOTTED_ALIAS})*"
+_FROM_IMPORT = (
+    rf"from[ \t]+(?:\.*{_DOTTED}|\.+)[ \t]+import[ \t]+"
+    rf"(?:\*|{_NAME_ALIAS}(?:[ \t]*,[ \t]*{_NAME_ALIAS})*)"
+)
+_TRIVIAL_LINE_RE = re.compile(rf"(?:{_IMPORT}|{_FROM_IMPORT})?[ \t]*(?:#[^\x00]*)?")
+
+
+def _is_import_only(text: str) -> bool:
+    """Check whether a module consists only of imports and comments.
+
+    Parameters
+    ----------
+    text : str
+        Source text with ``"\\n"`` line endings.
+
+    Returns
+    -------
+    bool
+        ``True`` if every line is blank, a comment or a single-line import.
+    """
+    fullmatch = _TRIVIAL_LINE_RE.fullmatch
+    return all(fullmatch(line) for line in text.split("\n"))
+
+
 def parse_python_file(
     file_path: Path,
     project_root: Optional[Path] = None,
-) -> Tuple[OutlineNode, Dict[str, SymbolDefinition], List[SymbolReference]]:
+    include_stores: bool = False,
+    collect_references: bool = True,
+) -> Tuple[OutlineNode, Dict[str, List[SymbolDefinition]], List[SymbolReference]]:
     """Parse a Python file into an outline tree, symbol definitions, and references.
 
     This function builds:
@@ -174,8 +294,9 @@ def parse_python_file(
     - a top-level :class:`OutlineNode` representing the module, with nested
       children for classes, functions, and variables;
     - a dictionary mapping fully qualified symbol names to their
-      :class:`SymbolDefinition`;
-    - a list of :class:`SymbolReference` objects for all Name occurrences.
+      :class:`SymbolDefinition` objects, in source order;
+    - a list of :class:`SymbolReference` objects for Name occurrences that
+      read a name.
 
     Parameters
     ----------
@@ -184,22 +305,78 @@ def parse_python_file(
     project_root : pathlib.Path or None, optional
         Root of the project, used to compute module-qualified names. If
         omitted, the module name defaults to the file stem.
+    include_stores : bool, optional
+        If ``True``, names that are assigned or deleted, including
+        comprehension targets, are reported as references too. Default is
+        ``False``, which only reports names that are read.
+    collect_references : bool, optional
+        If ``False``, references are not collected and an empty list is
+        returned for them, which saves walking expressions when only the
+        outline and definitions are needed. Default is ``True``.
 
     Returns
     -------
     module_node : OutlineNode
         The root outline node representing the module.
-    definitions : dict of str to SymbolDefinition
-        Mapping from qualified symbol names to their definitions.
+    definitions : dict of str to list of SymbolDefinition
+        Mapping from qualified symbol names to their definitions. A name
+        defined more than once in the file, e.g. a property getter and
+        setter or a reassigned variable, maps to all of its definitions in
+        source order.
     references : list of SymbolReference
         List of symbol references found in the file.
     """
     file_path = file_path.resolve()
-    text = file_path.read_text(encoding="utf-8")
-    tree = ast.parse(text, filename=str(file_path))
+    with open(file_path, "rb") as f:
+        st = os.fstat(f.fileno())
+        raw = f.read()
+    stamp = (st.st_mtime_ns, st.st_size)
+    # A UTF-8 byte order mark is not part of the source: it is dropped from
+    # the text and excluded from byte spans.
+    bom = len(codecs.BOM_UTF8) if raw.startswith(codecs.BOM_UTF8) else 0
+    # Same decoding and newline translation as ``Path.read_text``. The text
+    # only feeds the import pre-scan and reference contexts.
+    text = raw.decode("utf-8-sig")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     module_qualname = _compute_module_qualified_name(file_path, project_root)
-    module_doc = ast.get_docstring(tree, clean=True)
+    if _is_import_only(text):
+        # Nothing to collect besides the module itself; skip the AST.
+        module_def = SymbolDefinition(
+            parent_qualified_name=None,
+            name=module_qualname.split(".")[-1],
+            kind="module",
+            type_annotation=None,
+            file_path=file_path,
+            line=1,
+            column=0,
+            docstring=None,
+            init_docstring=None,
+            source_span=(bom, len(raw)),
+            source_stamp=stamp,
+            qualified_name=module_qualname,
+        )
+        return OutlineNode(symbol=module_def), {module_qualname: [module_def]}, []
+
+    # Parsing the bytes spares the tokenizer a re-encode of the text.
+    tree = ast.parse(raw, filename=str(file_path))
+    line_offsets = _byte_line_offsets(raw)
+    # Columns on the first line are counted after the byte order mark.
+    line_offsets[0] = bom
+
+    def source_span(node: ast.AST) -> Optional[Tuple[int, int]]:
+        """Return the byte span of a node, if it has end positions."""
+        end_lineno = getattr(node, "end_lineno", None)
+        end_col = getattr(node, "end_col_offset", None)
+        if end_lineno is None or end_col is None:
+            return None
+        return (
+            line_offsets[node.lineno - 1] + node.col_offset,
+            line_offsets[end_lineno - 1] + end_col,
+        )
+
+    module_doc = ast.get_docstring(tree, clean=False)
     module_def = SymbolDefinition(
         parent_qualified_name=None,
         name=module_qualname.split(".")[-1],
@@ -210,155 +387,257 @@ def parse_python_file(
         column=0,
         docstring=module_doc,
         init_docstring=None,
-        full_source=text,
+        source_span=(bom, len(raw)),
+        source_stamp=stamp,
         qualified_name=module_qualname,
     )
     module_node = OutlineNode(symbol=module_def)
 
-    definitions: Dict[str, SymbolDefinition] = {module_def.qualified_name: module_def}
-
-    def walk_body(
-        body: List[ast.stmt],
+    definitions: Dict[str, List[SymbolDefinition]] = {
+        module_def.qualified_name: [module_def]
+    }
+
+    def add_definition(defn: SymbolDefinition, parent_node: OutlineNode) -> OutlineNode:
+        """Record a definition and attach its outline node to its parent."""
+        definitions.setdefault(defn.qualified_name, []).append(defn)
+        node = OutlineNode(symbol=defn)
+        parent_node.children.append(node)
+        return node
+
+    # Handlers for the statements that define symbols, dispatched on the
+    # exact node type. Class and function handlers return the scope of
+    # their body.
+    def add_class(
+        node: ast.ClassDef, parent_def: SymbolDefinition, parent_node: OutlineNode
+    ) -> _Scope:
+        """Record a class definition."""
+        init_doc = None
+        for child in node.body:
+            if (
+                isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and child.name == "__init__"
+            ):
+                init_doc = ast.get_docstring(child, clean=False)
+                break
+        cls_def = SymbolDefinition(
+            parent_qualified_name=parent_def.qualified_name,
+            name=node.name,
+            kind="class",
+            type_annotation=None,
+            file_path=file_path,
+            line=getattr(node, "lineno", 0),
+            column=getattr(node, "col_offset", 0),
+            docstring=ast.get_docstring(node, clean=False),
+            init_docstring=init_doc,
+            source_span=source_span(node),
+            source_stamp=stamp,
+            qualified_name=f"{parent_def.qualified_name}.{node.name}",
+        )
+        return cls_def, add_definition(cls_def, parent_node)
+
+    def add_function(
+        node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
         parent_def: SymbolDefinition,
         parent_node: OutlineNode,
-    ) -> None:
-        """Recursively walk AST body to populate definitions and outline.
-
-        Parameters
-        ----------
-        body : list of ast.stmt
-            Statements in the current scope.
-        parent_def : SymbolDefinition
-            Definition of the current enclosing symbol (module, class, or
-            function).
-        parent_node : OutlineNode
-            Outline node corresponding to `parent_def`.
-        """
-        for node in body:
-            # Classes
-            if isinstance(node, ast.ClassDef):
-                qualname = f"{parent_def.qualified_name}.{node.name}"
-                doc = ast.get_docstring(node, clean=True)
-                init_doc = None
-                for child in node.body:
-                    if (
-                        isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
-                        and child.name == "__init__"
-                    ):
-                        init_doc = ast.get_docstring(child, clean=True)
-                        break
-                full_src = ast.get_source_segment(text, node) or ""
-                cls_def = SymbolDefinition(
-                    parent_qualified_name=parent_def.qualified_name,
-                    name=node.name,
-                    kind="class",
-                    type_annotation=None,
-                    file_path=file_path,
-                    line=getattr(node, "lineno", 0),
-                    column=getattr(node, "col_offset", 0),
-                    docstring=doc,
-                    init_docstring=init_doc,
-                    full_source=full_src,
-                    qualified_name=qualname,
-                )
-                definitions[cls_def.qualified_name] = cls_def
-                cls_node = OutlineNode(symbol=cls_def)
-                parent_node.children.append(cls_node)
-                walk_body(node.body, cls_def, cls_node)
-
-            # Functions (sync + async)
-            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                qualname = f"{parent_def.qualified_name}.{node.name}"
-                doc = ast.get_docstring(node, clean=True)
-                full_src = ast.get_source_segment(text, node) or ""
-                fn_def = SymbolDefinition(
+    ) -> _Scope:
+        """Record a function definition (sync or async)."""
+        fn_def = SymbolDefinition(
+            parent_qualified_name=parent_def.qualified_name,
+            name=node.name,
+            kind="function",
+            type_annotation=None,
+            file_path=file_path,
+            line=getattr(node, "lineno", 0),
+            column=getattr(node, "col_offset", 0),
+            docstring=ast.get_docstring(node, clean=False),
+            init_docstring=None,
+            source_span=source_span(node),
+            source_stamp=stamp,
+            qualified_name=f"{parent_def.qualified_name}.{node.name}",
+        )
+        return fn_def, add_definition(fn_def, parent_node)
+
+    def add_assign(
+        node: ast.Assign, parent_def: SymbolDefinition, parent_node: OutlineNode
+    ) -> _Scope:
+        """Record the simple variables assigned by a statement."""
+        span = source_span(node)
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                var_def = SymbolDefinition(
                     parent_qualified_name=parent_def.qualified_name,
-                    name=node.name,
-                    kind="function",
+                    name=target.id,
+                    kind="variable",
                     type_annotation=None,
                     file_path=file_path,
                     line=getattr(node, "lineno", 0),
                     column=getattr(node, "col_offset", 0),
-                    docstring=doc,
+                    docstring=None,
                     init_docstring=None,
-                    full_source=full_src,
-                    qualified_name=qualname,
+                    source_span=span,
+                    source_stamp=stamp,
+                    qualified_name=f"{parent_def.qualified_name}.{target.id}",
                 )
-                definitions[fn_def.qualified_name] = fn_def
-                fn_node = OutlineNode(symbol=fn_def)
-                parent_node.children.append(fn_node)
-                walk_body(node.body, fn_def, fn_node)
-
-            # Simple variables
-            elif isinstance(node, ast.Assign):
-                full_src = ast.get_source_segment(text, node) or ""
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        qualname = f"{parent_def.qualified_name}.{target.id}"
-                        var_def = SymbolDefinition(
-                            parent_qualified_name=parent_def.qualified_name,
-                            name=target.id,
-                            kind="variable",
-                            type_annotation=None,
-                            file_path=file_path,
-                            line=getattr(node, "lineno", 0),
-                            column=getattr(node, "col_offset", 0),
-                            docstring=None,
-                            init_docstring=None,
-                            full_source=full_src,
-                            qualified_name=qualname,
-                        )
-                        definitions[var_def.qualified_name] = var_def
-                        var_node = OutlineNode(symbol=var_def)
-                        parent_node.children.append(var_node)
-
-            # Annotated assignment
-            elif isinstance(node, ast.AnnAssign):
-                full_src = ast.get_source_segment(text, node) or ""
+                add_definition(var_def, parent_node)
+        return None
+
+    def add_ann_assign(
+        node: ast.AnnAssign, parent_def: SymbolDefinition, parent_node: OutlineNode
+    ) -> _Scope:
+        """Record an annotated variable."""
+        if not isinstance(node.target, ast.Name):
+            return None
+        type_ann = None
+        if node.annotation is not None:
+            try:
+                type_ann = ast.unparse(node.annotation)  # Python 3.9+
+            except AttributeError:
                 type_ann = None
-                if node.annotation is not None:
-                    try:
-                        type_ann = ast.unparse(node.annotation)  # Python 3.9+
-                    except AttributeError:
-                        type_ann = None
-                if isinstance(node.target, ast.Name):
-                    qualname = f"{parent_def.qualified_name}.{node.target.id}"
-                    var_def = SymbolDefinition(
-                        parent_qualified_name=parent_def.qualified_name,
-                        name=node.target.id,
-                        kind="variable",
-                        type_annotation=type_ann,
-                        file_path=file_path,
-                        line=getattr(node, "lineno", 0),
-                        column=getattr(node, "col_offset", 0),
-                        docstring=None,
-                        init_docstring=None,
-                        full_source=full_src,
-                        qualified_name=qualname,
-                    )
-                    definitions[var_def.qualified_name] = var_def
-                    var_node = OutlineNode(symbol=var_def)
-                    parent_node.children.append(var_node)
-
-            # You can extend here to handle imports, constants, etc.
-
-    walk_body(tree.body, module_def, module_node)
-
-    # Collect references via a single tree walk.
+        var_def = SymbolDefinition(
+            parent_qualified_name=parent_def.qualified_name,
+            name=node.target.id,
+            kind="variable",
+            type_annotation=type_ann,
+            file_path=file_path,
+            line=getattr(node, "lineno", 0),
+            column=getattr(node, "col_offset", 0),
+            docstring=None,
+            init_docstring=None,
+            source_span=source_span(node),
+            source_stamp=stamp,
+            qualified_name=f"{parent_def.qualified_name}.{node.target.id}",
+        )
+        add_definition(var_def, parent_node)
+        return None
+
+    # You can extend here to handle imports, constants, etc.
+    handlers: Dict[type, Callable[[Any, SymbolDefinition, OutlineNode], _Scope]] = {
+        ast.ClassDef: add_class,
+        ast.FunctionDef: add_function,
+        ast.AsyncFunctionDef: add_function,
+        ast.Assign: add_assign,
+        ast.AnnAssign: add_ann_assign,
+    }
+
     references: List[SymbolReference] = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Name):
+    lines = text.splitlines() if collect_references else []
+    # References on the same line share one context string.
+    contexts: Dict[int, str] = {}
+
+    # Definitions and references are collected in one depth-first walk.
+    # Each entry is a node and, for statements directly in the body of the
+    # module, a class or a function, the definition and outline node of
+    # that scope. Only those statements define symbols; e.g. assignments
+    # nested in ``if`` blocks do not.
+    stack: List[Tuple[ast.AST, _Scope]] = [
+        (stmt, (module_def, module_node)) for stmt in reversed(tree.body)
+    ]
+    while stack:
+        node, scope = stack.pop()
+        node_type = type(node)
+        body_scope: _Scope = None
+
+        if node_type is ast.Name:
+            if not include_stores and type(node.ctx) is not ast.Load:
+                continue
             line = getattr(node, "lineno", 0)
             col = getattr(node, "col_offset", 0)
-            context = _extract_context_window(text, line, window=1)
-            references.append(
-                SymbolReference(
-                    symbol=node.id,
-                    file_path=file_path,
-                    line=line,
-                    column=col,
-                    context=context,
+            context = contexts.get(line)
+            if context is None:
+                context = contexts[line] = _extract_context_window(
+                    lines, line, window=1
                 )
-            )
+            # Positional arguments (symbol, file_path, line, column, context)
+            # bind about twice as fast as keywords in this hot loop.
+            references.append(SymbolReference(node.id, file_path, line, col, context))
+            continue
+
+        if scope is not None:
+            handler = handlers.get(node_type)
+            if handler is not None:
+                body_scope = handler(node, *scope)
+
+        if not collect_references:
+            # Only statements in the body of a scope can define symbols.
+            if body_scope is not None:
+                stack.extend((stmt, body_scope) for stmt in reversed(node.body))
+            continue
+
+        # Queue the children, reversed so that they are visited in order and
+        # each definition's body is done before its next sibling.
+        # Leaf nodes such as expression contexts and operators have no
+        # fields and are not queued at all.
+        children: List[Tuple[ast.AST, _Scope]] = []
+        fields = node._fields
+        if not include_stores and node_type is ast.comprehension:
+            # Comprehension targets only bind names.
+            fields = ("iter", "ifs")
+        for field_name in fields:
+            value = getattr(node, field_name, None)
+            if isinstance(value, ast.AST):
+                if value._fields:
+                    children.append((value, None))
+            elif isinstance(value, list):
+                child_scope = body_scope if field_name == "body" else None
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        children.append((item, child_scope))
+        stack.extend(reversed(children))
 
     return module_node, definitions, references
+
+
+def parse_python_files(
+    file_paths: Iterable[Path],
+    project_root: Optional[Path] = None,
+    workers: Optional[int] = None,
+    parse: Optional[Callable[[Path], Any]] = None,
+) -> Iterator[Tuple[Path, Any]]:
+    """Parse several Python files in worker processes.
+
+    Parsing is CPU-bound and independent per file, so files are spread over
+    a pool of processes. Results are yielded in the order of `file_paths`.
+
+    Parameters
+    ----------
+    file_paths : iterable of pathlib.Path
+        Paths to the Python source files.
+    project_root : pathlib.Path or None, optional
+        Root of the project, used to compute module-qualified names. Ignored
+        if `parse` is given.
+    workers : int or None, optional
+        Number of worker processes. Defaults to the number of CPUs. With a
+        single worker, or fewer than two files, files are parsed in the
+        calling process.
+    parse : callable or None, optional
+        Function called with each file path to parse it, e.g. a cached
+        variant of :func:`parse_python_file`. It must be picklable, such as
+        a module-level function or a :func:`functools.partial` of one.
+        Defaults to :func:`parse_python_file` with `project_root`.
+
+    Yields
+    ------
+    tuple
+        The file path and the result of `parse` for that file.
+
+    Raises
+    ------
+    Exception
+        Any error raised while parsing a file, e.g. :class:`SyntaxError`.
+    """
+    file_paths = list(file_paths)
+    workers = workers or os.cpu_count() or 1
+    if parse is None:
+        parse = functools.partial(parse_python_file, project_root=project_root)
+    if workers <= 1 or len(file_paths) < 2:
+        for file_path in file_paths:
+            yield file_path, parse(file_path)
+        return
+
+    # Spawned rather than forked workers, since callers may run threads.
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(file_paths)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        results = pool.map(parse, file_paths, chunksize=_CHUNKSIZE)
+        yield from zip(file_paths, results)
@@ -0,0 +1,7 @@
+# conftest.py
+import sys
+from pathlib import Path
+
+# The engine imports its sibling modules as top-level modules, like the
+# server does when run from the server directory.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,29 @@
+# test_engine.py
+import os
+
+from engine import LSPEngine
+
+MODULE = '"""Module."""\nclass Foo:\n    """Foo."""\n    x = 1\n'
+
+
+def _edit(path, text):
+    """Rewrite a file and make sure its modification time changes."""
+    mtime_ns = path.stat().st_mtime_ns
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+
+def test_get_definition_full_sees_edits_after_caching(tmp_path):
+    module = tmp_path / "mod.py"
+    module.write_text(MODULE)
+    engine = LSPEngine(tmp_path, parallel=False, background=False)
+
+    before = engine.get_definition_full(symbol="Foo")
+    assert before["line"] == 2
+    assert before["source"].startswith("class Foo:")
+
+    _edit(module, "# A comment added by an edit.\n" + MODULE.replace("x = 1", "y = 2"))
+
+    after = engine.get_definition_full(symbol="Foo")
+    assert after["line"] == 3
+    assert after["source"] == 'class Foo:\n    """Foo."""\n    y = 2'
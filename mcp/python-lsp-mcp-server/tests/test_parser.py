@@ -0,0 +1,26 @@
+# test_parser.py
+import pytest
+
+from parser import parse_python_file
+
+
+@pytest.mark.parametrize(
+    "source",
+    ["import class\n", "from x import def\n", "import os as if\n", "from if import x\n"],
+)
+def test_import_with_keyword_is_a_syntax_error(tmp_path, source):
+    path = tmp_path / "mod.py"
+    path.write_text(source)
+    with pytest.raises(SyntaxError):
+        parse_python_file(path, project_root=tmp_path)
+
+
+def test_import_only_module_yields_module_symbol(tmp_path):
+    path = tmp_path / "mod.py"
+    path.write_text("import os.path as osp, sys  # comment\nfrom . import match\n")
+    module_node, definitions, references = parse_python_file(
+        path, project_root=tmp_path
+    )
+    assert list(definitions) == ["mod"]
+    assert module_node.children == []
+    assert references == []
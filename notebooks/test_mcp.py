@@ -1,7 +1,117 @@
+import argparse
 import asyncio
-import pprint
+import json
+import os
+import sys
+from pathlib import Path
 
+import httpx
 from fastmcp import Client
+from fastmcp.client.transports import PythonStdioTransport, StreamableHttpTransport
+
+try:
+    from jsonschema import Draft202012Validator
+except ImportError:  # optional, arguments are then only checked by the server
+    Draft202012Validator = None
+
+try:
+    import orjson
+except ImportError:  # optional, the standard library encoder is used instead
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # optional, the default asyncio event loop is used instead
+    uvloop = None
+
+SERVER_URL = "http://127.0.0.1:8000/mcp"
+SERVER_ROOT = Path(__file__).resolve().parent.parent / "mcp" / "python-lsp-mcp-server"
+
+# "http" talks to a server already listening on SERVER_URL; "stdio" spawns the
+# server as a subprocess and talks to it over pipes, which skips HTTP framing
+# when the server runs on the same machine anyway.
+TRANSPORT = os.environ.get("TRANSPORT", "http")
+# Project indexed by a server spawned for the stdio transport.
+PROJECT_ROOT = os.environ.get("PROJECT_ROOT", str(SERVER_ROOT.parent.parent))
+# Seconds an idle HTTP connection is kept open for reuse (httpx defaults to 5).
+HTTP_KEEPALIVE = float(os.environ.get("MCP_HTTPX_KEEPALIVE", "120"))
+# Tool calls in flight at once: enough to overlap round trips without queueing
+# dozens of requests on the server.
+MAX_CONCURRENCY = int(os.environ.get("MCP_CONCURRENCY", "8"))
+
+
+def http_client(headers=None, timeout=None, auth=None) -> httpx.AsyncClient:
+    """
+    Create the httpx client of the HTTP transport.
+
+    Same defaults as the MCP SDK's client, but with a larger connection pool
+    and a longer keep-alive, so that idle gaps between calls do not force new
+    connections.
+
+    Args:
+      headers: Headers sent with every request.
+      timeout: Request timeout, 30 seconds if not given.
+      auth: Authentication handler.
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout if timeout is not None else httpx.Timeout(30.0),
+        auth=auth,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=HTTP_KEEPALIVE,
+        ),
+    )
+
+
+def make_transport(transport: str = TRANSPORT):
+    """
+    Build what the MCP client connects to.
+
+    Args:
+      transport: "http" or "stdio".
+
+    Returns:
+      A fastmcp transport.
+    """
+    if transport == "http":
+        return StreamableHttpTransport(SERVER_URL, httpx_client_factory=http_client)
+    if transport == "stdio":
+        env = dict(os.environ)
+        # The engine imports its sibling modules from src/ directly.
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(SERVER_ROOT / "src"), env.get("PYTHONPATH")])
+        )
+        return PythonStdioTransport(
+            script_path=SERVER_ROOT / "server.py",
+            args=["--project-root", PROJECT_ROOT, "--transport", "stdio"],
+            env=env,
+            cwd=str(SERVER_ROOT),
+        )
+    raise ValueError(f"Unknown transport {transport!r}, expected 'http' or 'stdio'")
+
+
+def to_json(result) -> str:
+    """
+    Render a tool result as indented JSON.
+
+    Args:
+      result: A fastmcp CallToolResult, or any JSON-like value.
+
+    Returns:
+      The structured content of a CallToolResult (or the text of its content
+      blocks if it has none), or `result` itself, as JSON.
+    """
+    if hasattr(result, "structured_content"):
+        if result.structured_content is not None:
+            result = result.structured_content
+        else:
+            result = [getattr(block, "text", repr(block)) for block in result.content]
+    if orjson is not None:
+        return orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(result, indent=2, ensure_ascii=False, default=str)
 
 
 def pretty_print(tool_name: str, result):
@@ -10,41 +120,200 @@ def pretty_print(tool_name: str, result):
 
     Args:
       tool_name: Name of the tool you called (e.g., "definition_short").
-      result: The raw result dict/list returned by the tool.
+      result: The raw result returned by the tool.
     """
-    print(f"\n=== {tool_name} ===")
-    pp = pprint.PrettyPrinter(indent=2, width=100, compact=False)
-    pp.pprint(result)
-    print("=" * (6 + len(tool_name)))
+    # One write, so a line-buffered stdout flushes once per result.
+    sys.stdout.write(
+        f"\n=== {tool_name} ===\n{to_json(result)}\n{'=' * (6 + len(tool_name))}\n"
+    )
 
 
-async def test_tools():
-    async with Client("http://127.0.0.1:8000/mcp") as client:
-        resp1 = await client.call_tool(
-            "definition_short", {"symbol": "MedievalLMTokenizer", "max_chars": 500}
-        )
-        pretty_print("definition_short", resp1)
+class MCPHarness:
+    """
+    One MCP client session shared by every tool call.
 
-        # resp2 = await client.call_tool(
-        #     "definition_full", {"symbol": "MyClass", "max_chars": 2000}
-        # )
-        # pretty_print("definition_full", resp2)
+    The session (and its connection) is opened once on entry and closed on
+    exit, instead of reconnecting for each call. The tool schemas are fetched
+    once on entry too, and (if jsonschema is installed) arguments are checked
+    against them before sending, so bad calls fail without a round trip.
 
-        # resp3 = await client.call_tool(
-        #     "references", {"symbol": "MyClass", "max_results": 50}
-        # )
-        # pretty_print("references", resp3)
-        # # repeat for other symbols
-        # resp = await client.call_tool(
-        #     "outline", {"file_path": "tests/demo.py", "symbol": None, "max_chars": 300}
-        # )
-        # pretty_print("outline (module)", resp)
+    Args:
+      transport: fastmcp transport, see `make_transport`.
+      max_concurrency: Maximum number of tool calls in flight at once,
+        MAX_CONCURRENCY by default.
+      cache: Reuse the result of an earlier identical call (same tool and
+        arguments) instead of calling the server again. Off by default, since
+        results go stale when the indexed sources change.
+    """
+
+    def __init__(
+        self,
+        transport=None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        cache: bool = False,
+    ):
+        self._client = Client(transport if transport is not None else make_transport())
+        self._limit = asyncio.Semaphore(max_concurrency)
+        self._cache = {} if cache else None
+        self._validators = {}
+
+    async def __aenter__(self):
+        await self._client.__aenter__()
+        try:
+            tools = await self._client.list_tools()
+        except BaseException:
+            await self._client.__aexit__(None, None, None)
+            raise
+        self._validators = {
+            tool.name: (
+                Draft202012Validator(tool.inputSchema)
+                if Draft202012Validator is not None
+                else None
+            )
+            for tool in tools
+        }
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._client.__aexit__(*exc_info)
+
+    async def call(self, tool_name: str, args: dict):
+        """
+        Call a tool on the shared session.
+
+        Args:
+          tool_name: Name of the tool to call (e.g., "definition_short").
+          args: Arguments of the tool.
+
+        Raises:
+          ValueError: If the server has no such tool.
+          jsonschema.ValidationError: If `args` do not match the tool's schema.
+        """
+        if tool_name not in self._validators:
+            raise ValueError(f"Unknown tool {tool_name!r}")
+        validator = self._validators[tool_name]
+        if validator is not None:
+            validator.validate(args)
+        if self._cache is not None:
+            key = (tool_name, json.dumps(args, sort_keys=True))
+            if key in self._cache:
+                return self._cache[key]
+        async with self._limit:
+            result = await self._client.call_tool(tool_name, args)
+        if self._cache is not None:
+            self._cache[key] = result
+        return result
+
+    async def call_many(self, specs: list):
+        """
+        Call several independent tools concurrently.
+
+        Args:
+          specs: (tool_name, args) pairs.
+
+        Returns:
+          The results, in the order of `specs`.
+        """
+        return await asyncio.gather(*(self.call(name, args) for name, args in specs))
+
+    async def iter_results(self, specs: list):
+        """
+        Call several independent tools concurrently, yielding each result as
+        soon as it arrives.
+
+        Args:
+          specs: (tool_name, args) pairs.
+
+        Yields:
+          (tool_name, result) pairs, in completion order.
+        """
 
-        # resp2 = await client.call_tool(
+        async def run(tool_name: str, args: dict):
+            return tool_name, await self.call(tool_name, args)
+
+        for next_done in asyncio.as_completed([run(*spec) for spec in specs]):
+            yield await next_done
+
+
+async def test_tools(harness: MCPHarness):
+    # The calls are independent, so they are sent together rather than one
+    # round trip after another, and each result is printed as soon as it
+    # arrives instead of after the slowest one.
+    specs = [
+        ("definition_short", {"symbol": "MedievalLMTokenizer", "max_chars": 500}),
+        # ("definition_full", {"symbol": "MyClass", "max_chars": 2000}),
+        # ("references", {"symbol": "MyClass", "max_results": 50}),
+        # # repeat for other symbols
+        # (
+        #     "outline",
+        #     {"file_path": "tests/demo.py", "symbol": None, "max_chars": 300},
+        # ),
+        # (
         #     "outline",
         #     {"file_path": "tests/demo.py", "symbol": "MyClass", "max_chars": 300},
-        # )
-        # pretty_print("outline MyClass", resp2)
+        # ),
+    ]
+    async for tool_name, result in harness.iter_results(specs):
+        pretty_print(tool_name, result)
+
+
+async def repl(harness: MCPHarness):
+    """
+    Read tool calls from stdin and run them on the open session.
+
+    Each line is a tool name followed by its arguments as a JSON object, e.g.
+    `definition_short {"symbol": "LSPEngine"}`. The event loop and session
+    stay up between calls, so only the first call pays for connecting. An
+    empty line is ignored; `quit` or end of input exits.
+
+    Args:
+      harness: Entered harness to call the tools on.
+    """
+    while True:
+        try:
+            line = await asyncio.to_thread(input, "mcp> ")
+        except EOFError:
+            break
+        line = line.strip()
+        if not line:
+            continue
+        if line in ("quit", "exit"):
+            break
+        tool_name, _, raw_args = line.partition(" ")
+        try:
+            args = json.loads(raw_args) if raw_args.strip() else {}
+            result = await harness.call(tool_name, args)
+        except Exception as exc:  # keep the session open after a bad call
+            print(f"{type(exc).__name__}: {exc}")
+            continue
+        pretty_print(tool_name, result)
+
+
+async def main(interactive: bool = False, cache: bool = False):
+    async with MCPHarness(cache=cache) as harness:
+        if interactive:
+            await repl(harness)
+        else:
+            await test_tools(harness)
+
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Call the tools of an MCP server.")
+    parser.add_argument(
+        "--repl",
+        action="store_true",
+        help="Read tool calls from stdin on one session instead of running the "
+        "built-in calls.",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Answer repeated identical tool calls from memory.",
+    )
+    args = parser.parse_args()
 
-asyncio.run(test_tools())
+    # asyncio.run only takes a loop factory from Python 3.12 on.
+    with asyncio.Runner(
+        loop_factory=uvloop.new_event_loop if uvloop else None
+    ) as runner:
+        runner.run(main(interactive=args.repl, cache=args.cache))